@@ -17,6 +17,7 @@ This adds the following command line options.
 # GLOBAL IMPORTS
 # =============================================================================================
 
+import copy
 import logging
 
 import pytest
@@ -32,6 +33,11 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "slow: marks tests as slow (deselect with `-m 'not slow'`)"
     )
+    config.addinivalue_line(
+        "markers",
+        "ambertools: marks slow tests that run AM1-BCC through AmberTools "
+        "(select with `--runslow -m ambertools`)",
+    )
 
 
 # =============================================================================================
@@ -40,8 +46,8 @@ def pytest_configure(config):
 
 
 def untar_full_alkethoh_and_freesolv_set():
-    """When running slow tests, we unpack the full AlkEthOH and FreeSolv test
-    sets in advance to speed things up.
+    """Unpack the full AlkEthOH and FreeSolv test sets in one go, which is
+    faster than extracting the molecules one test case at a time.
 
     See
         test_forcefield.py::test_alkethoh_parameters_assignment
@@ -59,6 +65,194 @@ def untar_full_alkethoh_and_freesolv_set():
             tar.extractall(path=molecule_dir_path)
 
 
+# =============================================================================================
+# FIXTURES
+# =============================================================================================
+
+
+@pytest.fixture(scope="session")
+def full_alkethoh_and_freesolv_set(request):
+    """Unpack the full AlkEthOH and FreeSolv test sets the first time a test needs them.
+
+    Without --runslow only a few molecules of each set are tested, and those
+    are extracted one at a time as they are requested.
+    """
+    if request.config.getoption("runslow"):
+        untar_full_alkethoh_and_freesolv_set()
+
+
+@pytest.fixture(scope="session")
+def _ethanol_prototype():
+    """Build the reference ethanol molecule once per test session."""
+    from openforcefield.tests.test_forcefield import create_ethanol
+
+    return create_ethanol()
+
+
+@pytest.fixture
+def ethanol(_ethanol_prototype):
+    """A fresh, freely modifiable copy of the reference ethanol molecule."""
+    return copy.deepcopy(_ethanol_prototype)
+
+
+@pytest.fixture(scope="session")
+def _cyclohexane_prototype():
+    """Build the reference cyclohexane molecule once per test session."""
+    from openforcefield.tests.test_forcefield import create_cyclohexane
+
+    return create_cyclohexane()
+
+
+@pytest.fixture
+def cyclohexane(_cyclohexane_prototype):
+    """A fresh, freely modifiable copy of the reference cyclohexane molecule."""
+    return copy.deepcopy(_cyclohexane_prototype)
+
+
+@pytest.fixture(scope="session")
+def _acetate_prototype():
+    """Build the reference acetate molecule once per test session."""
+    from openforcefield.tests.test_forcefield import create_acetate
+
+    return create_acetate()
+
+
+@pytest.fixture
+def acetate(_acetate_prototype):
+    """A fresh, freely modifiable copy of the reference acetate molecule."""
+    return copy.deepcopy(_acetate_prototype)
+
+
+@pytest.fixture(scope="session")
+def _cid20742535_neutral_prototype():
+    """Read the neutral form of PubChem CID 20742535 once per test session."""
+    from openforcefield.topology import Molecule
+    from openforcefield.utils import get_data_file_path
+
+    return Molecule.from_file(get_data_file_path("molecules/CID20742535_neutral.sdf"))
+
+
+@pytest.fixture
+def cid20742535_neutral(_cid20742535_neutral_prototype):
+    """A fresh, freely modifiable copy of neutral CID 20742535."""
+    return copy.deepcopy(_cid20742535_neutral_prototype)
+
+
+@pytest.fixture(scope="session")
+def _cid20742535_anion_prototype():
+    """Read the anionic form of PubChem CID 20742535 once per test session."""
+    from openforcefield.topology import Molecule
+    from openforcefield.utils import get_data_file_path
+
+    return Molecule.from_file(get_data_file_path("molecules/CID20742535_anion.sdf"))
+
+
+@pytest.fixture
+def cid20742535_anion(_cid20742535_anion_prototype):
+    """A fresh, freely modifiable copy of anionic CID 20742535."""
+    return copy.deepcopy(_cid20742535_anion_prototype)
+
+
+@pytest.fixture(scope="session")
+def _ethanol_sdf_prototype(rdkit_wrapper):
+    """Read ethanol with its conformer from ``molecules/ethanol.sdf`` with RDKit, once per test session."""
+    from openforcefield.utils import get_data_file_path
+
+    return rdkit_wrapper.from_file(
+        file_path=get_data_file_path("molecules/ethanol.sdf"), file_format="SDF"
+    )[0]
+
+
+@pytest.fixture
+def ethanol_sdf(_ethanol_sdf_prototype):
+    """A fresh, freely modifiable copy of the ethanol read from ``molecules/ethanol.sdf``."""
+    return copy.deepcopy(_ethanol_sdf_prototype)
+
+
+@pytest.fixture(scope="session")
+def _toluene_prototype(openeye_wrapper):
+    """Read toluene from ``molecules/toluene.sdf`` with OpenEye once per test session."""
+    from openforcefield.topology import Molecule
+    from openforcefield.utils import get_data_file_path
+
+    return Molecule.from_file(
+        get_data_file_path("molecules/toluene.sdf"), toolkit_registry=openeye_wrapper
+    )
+
+
+@pytest.fixture
+def toluene_mol(_toluene_prototype):
+    """A fresh, freely modifiable copy of the reference toluene molecule."""
+    return copy.deepcopy(_toluene_prototype)
+
+
+@pytest.fixture(scope="session")
+def openeye_wrapper():
+    """A shared OpenEyeToolkitWrapper, skipping if OpenEye is unavailable."""
+    from openforcefield.utils.toolkits import OpenEyeToolkitWrapper
+
+    if not OpenEyeToolkitWrapper.is_available():
+        pytest.skip("Test requires OE toolkit")
+    return OpenEyeToolkitWrapper()
+
+
+@pytest.fixture(scope="session")
+def rdkit_wrapper():
+    """A shared RDKitToolkitWrapper, skipping if RDKit is not installed."""
+    pytest.importorskip("rdkit")
+    from openforcefield.utils.toolkits import RDKitToolkitWrapper
+
+    return RDKitToolkitWrapper()
+
+
+@pytest.fixture(scope="session")
+def ambertools_wrapper():
+    """A shared AmberToolsToolkitWrapper, skipping if AmberTools is unavailable."""
+    from openforcefield.utils.toolkits import AmberToolsToolkitWrapper
+
+    if not AmberToolsToolkitWrapper.is_available():
+        pytest.skip("Test requires AmberTools")
+    return AmberToolsToolkitWrapper()
+
+
+@pytest.fixture(scope="session")
+def openeye_registry(openeye_wrapper):
+    """A shared ToolkitRegistry containing only the OpenEye toolkit.
+
+    Tests that need to modify the registry should work on a deep copy.
+    """
+    from openforcefield.utils.toolkits import ToolkitRegistry
+
+    registry = ToolkitRegistry()
+    registry.register_toolkit(openeye_wrapper)
+    return registry
+
+
+@pytest.fixture(scope="session")
+def ambertools_registry(ambertools_wrapper, rdkit_wrapper):
+    """A shared ToolkitRegistry containing AmberTools, backed up by RDKit.
+
+    Tests that need to modify the registry should work on a deep copy.
+    """
+    from openforcefield.utils.toolkits import ToolkitRegistry
+
+    registry = ToolkitRegistry()
+    registry.register_toolkit(ambertools_wrapper)
+    registry.register_toolkit(rdkit_wrapper)
+    return registry
+
+
+@pytest.fixture(scope="session")
+def builtin_registry():
+    """A shared ToolkitRegistry containing only the built-in toolkit.
+
+    Tests that need to modify the registry should work on a deep copy.
+    """
+    from openforcefield.utils.toolkits import BuiltInToolkitWrapper, ToolkitRegistry
+
+    return ToolkitRegistry(toolkit_precedence=[BuiltInToolkitWrapper])
+
+
 # =============================================================================================
 # CONFIGURATION
 # =============================================================================================
@@ -114,12 +308,8 @@ def pytest_addoption(parser):
 
 def pytest_collection_modifyitems(config, items):
 
-    if config.getoption("runslow"):
-        # If --runslow is given, we don't have to mark items for skipping,
-        # but we need to extract the whole AlkEthOH and FreeSolv sets (see
-        # test_forcefield::test_alkethoh/freesolv_parameters_assignment).
-        untar_full_alkethoh_and_freesolv_set()
-    else:
+    # If --runslow is given, we don't have to mark items for skipping.
+    if not config.getoption("runslow"):
         # Mark for skipping all items marked as slow.
         skip_slow = pytest.mark.skip(
             reason="specify --runslow pytest option to run this test."
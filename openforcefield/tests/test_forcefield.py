@@ -2751,7 +2751,9 @@ class TestForceFieldParameterAssignment:
     @pytest.mark.parametrize(
         "alkethoh_id", generate_alkethoh_parameters_assignment_cases()
     )
-    def test_alkethoh_parameters_assignment(self, alkethoh_id):
+    def test_alkethoh_parameters_assignment(
+        self, full_alkethoh_and_freesolv_set, alkethoh_id
+    ):
         """Test that ForceField assign parameters correctly in the AlkEthOH set.
         The test compares the System parameters of a AlkEthOH molecule
         parameterized with AMBER and Frosst_AlkEthOH_parmAtFrosst.offxml.
@@ -2881,7 +2883,11 @@ class TestForceFieldParameterAssignment:
         generate_freesolv_parameters_assignment_cases(),
     )
     def test_freesolv_parameters_assignment(
-        self, freesolv_id, forcefield_version, allow_undefined_stereo
+        self,
+        full_alkethoh_and_freesolv_set,
+        freesolv_id,
+        forcefield_version,
+        allow_undefined_stereo,
     ):
         """Regression test on parameters assignment based on the FreeSolv set used in the 0.1 paper.
 
@@ -625,6 +625,45 @@ class TestMolecule:
                 f"The required toolkit ({toolkit_class.toolkit_name}) is not available."
             )
 
+    @requires_rdkit
+    def test_smiles_cache_cleared_on_stereo_change(self):
+        """Make sure that changing atom stereochemistry invalidates the smiles cache."""
+        toolkit = RDKitToolkitWrapper()
+        mol = Molecule.from_smiles("C[C@H](F)Cl", toolkit_registry=toolkit)
+        expected_flipped_smiles = Molecule.from_smiles(
+            "C[C@@H](F)Cl", toolkit_registry=toolkit
+        ).to_smiles(toolkit_registry=toolkit)
+
+        # Fill the cache
+        smiles = mol.to_smiles(toolkit_registry=toolkit)
+        assert mol._cached_smiles
+
+        # Invert the stereocenter; the next call must not return the cached smiles
+        stereocenter = mol.atoms[1]
+        stereocenter.stereochemistry = {"R": "S", "S": "R"}[
+            stereocenter.stereochemistry
+        ]
+        flipped_smiles = mol.to_smiles(toolkit_registry=toolkit)
+        assert flipped_smiles != smiles
+        assert flipped_smiles == expected_flipped_smiles
+
+    @requires_rdkit
+    def test_smiles_cache_cleared_on_formal_charge_change(self):
+        """Make sure that changing an atom's formal charge invalidates the smiles cache."""
+        toolkit = RDKitToolkitWrapper()
+        mol = Molecule.from_smiles("CN", toolkit_registry=toolkit)
+
+        # Fill the cache
+        smiles = mol.to_smiles(toolkit_registry=toolkit)
+        assert mol._cached_smiles
+
+        nitrogen = [atom for atom in mol.atoms if atom.atomic_number == 7][0]
+        nitrogen.formal_charge = 1
+        assert not mol._cached_smiles
+        charged_smiles = mol.to_smiles(toolkit_registry=toolkit)
+        assert charged_smiles != smiles
+        assert "+" in charged_smiles
+
     mapped_types = [
         {"atom_map": None},
         {"atom_map": {0: 0}},
@@ -1404,6 +1443,19 @@ class TestMolecule:
             bond_stereochemistry_matching=True,
         )[0]
 
+    def test_isomorphic_no_nitrogen_stereo_skips_toolkit(self):
+        """Test that stripping pyrimidal nitrogen stereo does not need a toolkit if there is none to strip"""
+        ethanol = create_ethanol()
+        ethanol_reverse = create_reversed_ethanol()
+
+        # An empty registry can not perform the SMARTS match used to strip the stereo
+        assert Molecule.are_isomorphic(
+            ethanol,
+            ethanol_reverse,
+            strip_pyrimidal_n_atom_stereo=True,
+            toolkit_registry=ToolkitRegistry(),
+        )[0]
+
     def test_remap(self):
         """Test the remap function which should return a new molecule in the requested ordering"""
         # the order here is CCO
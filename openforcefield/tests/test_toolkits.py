@@ -13,7 +13,7 @@ Tests for cheminformatics toolkit wrappers
 # GLOBAL IMPORTS
 # =============================================================================================
 
-from tempfile import NamedTemporaryFile
+import re
 
 import numpy as np
 import pytest
@@ -22,7 +22,6 @@ from simtk import unit
 
 from openforcefield.tests.test_forcefield import (
     create_acetaldehyde,
-    create_acetate,
     create_cyclohexane,
     create_ethanol,
     create_reversed_ethanol,
@@ -51,6 +50,39 @@ from openforcefield.utils.toolkits import (
     UndefinedStereochemistryError,
 )
 
+# =============================================================================================
+# DATA FILES
+# =============================================================================================
+
+# Resolve the data files used by this module once, rather than in every test
+ALKETHOH_MOL2 = get_data_file_path("molecules/AlkEthOH_test_filt1_ff.mol2")
+BUTANE_MULTI_SDF = get_data_file_path("molecules/butane_multi.sdf")
+ETHANOL_PARTIAL_CHARGES_SDF = get_data_file_path(
+    "molecules/ethanol_partial_charges.sdf"
+)
+ETHANOL_SDF = get_data_file_path("molecules/ethanol.sdf")
+METHANE_MULTICONFORMER_PROPERTIES_SDF = get_data_file_path(
+    "molecules/methane_multiconformer_properties.sdf"
+)
+METHANE_MULTICONFORMER_SDF = get_data_file_path("molecules/methane_multiconformer.sdf")
+MINI_DRUG_BANK_SDF = get_data_file_path("molecules/MiniDrugBank.sdf")
+TOLUENE_CHARGED_MOL2 = get_data_file_path("molecules/toluene_charged.mol2")
+TOLUENE_MOL2 = get_data_file_path("molecules/toluene.mol2")
+TOLUENE_PDB = get_data_file_path("molecules/toluene.pdb")
+TOLUENE_SDF = get_data_file_path("molecules/toluene.sdf")
+
+# Matches the partial charge SD data item written by the toolkits and captures
+# the line of charges that follows it
+_CHARGE_RE = re.compile(r">\s+<atom\.dprop\.PartialCharge>[^\n]*\n([^\n]*)")
+
+# SMARTS for the ethanol bonds ignored in test_find_rotatable_bonds
+C_O_FORWARDS_SMARTS = "[#6:1]-[#8:2]"
+C_O_BACKWARDS_SMARTS = "[#8:1]-[#6:2]"
+C_C_SMARTS = "[#6:1]-[#6:2]"
+# SMARTS matching the bonds to terminal rotors, tagged in either direction
+TERMINAL_FORWARDS_SMARTS = "[*]~[*:1]-[X2H1,X3H2,X4H3:2]-[#1]"
+TERMINAL_BACKWARDS_SMARTS = "[#1]-[X2H1,X3H2,X4H3:1]-[*:2]~[*]"
+
 # =============================================================================================
 # FIXTURES
 # =============================================================================================
@@ -64,7 +96,7 @@ def get_mini_drug_bank(toolkit_class):
     if toolkit_class.is_available():
         toolkit = toolkit_class()
         molecules = Molecule.from_file(
-            get_data_file_path("molecules/MiniDrugBank.sdf"),
+            MINI_DRUG_BANK_SDF,
             "sdf",
             toolkit_registry=toolkit,
             allow_undefined_stereo=True,
@@ -75,6 +107,37 @@ def get_mini_drug_bank(toolkit_class):
     return molecules
 
 
+def _bond_arrays(molecule):
+    """Gather the aromaticity, atomic numbers and fractional bond order of each bond
+    into arrays, so per-bond checks can be written as masked array comparisons"""
+    bonds = molecule.bonds
+    is_aromatic = np.array([bond.is_aromatic for bond in bonds], dtype=bool)
+    atomic_number_1 = np.array([bond.atom1.atomic_number for bond in bonds])
+    atomic_number_2 = np.array([bond.atom2.atomic_number for bond in bonds])
+    wbo = np.array([bond.fractional_bond_order for bond in bonds], dtype=float)
+    return is_aromatic, atomic_number_1, atomic_number_2, wbo
+
+
+def _validate_wbos(molecule, c_o_lower, c_o_upper):
+    """Check the fractional bond orders of CID 20742535 (neutral or anion) fall in
+    the expected ranges, and return the Wiberg bond orders of its C-O and C-C bonds"""
+    is_aromatic, z1, z2, wbo = _bond_arrays(molecule)
+    has_h = ~is_aromatic & ((z1 == 1) | (z2 == 1))
+    has_o = ~is_aromatic & ~has_h & ((z1 == 8) | (z2 == 8))
+    is_c_c = ~(is_aromatic | has_h | has_o)
+    # Checking aromatic bonds
+    assert np.all((1.05 < wbo[is_aromatic]) & (wbo[is_aromatic] < 1.65))
+    # Checking bond order of C-H or O-H bonds are around 1
+    assert np.all((0.85 < wbo[has_h]) & (wbo[has_h] < 1.05))
+    # Checking C-O single bond
+    assert np.all((c_o_lower < wbo[has_o]) & (wbo[has_o] < c_o_upper))
+    # Should be C-C single bond
+    c_c_bond = molecule.get_bond_between(4, 6)
+    assert [molecule.bonds[i] for i in np.flatnonzero(is_c_c)] == [c_c_bond]
+    assert 1.0 < c_c_bond.fractional_bond_order < 1.3
+    return wbo[has_o][-1], c_c_bond.fractional_bond_order
+
+
 openeye_inchi_stereochemistry_lost = [
     "DrugBank_2799",
     "DrugBank_5414",
@@ -201,89 +264,256 @@ rdkit_inchi_isomorphic_fails = [
 ]
 rdkit_inchi_roundtrip_mangled = ["DrugBank_2684"]
 
+# Names of the session-scoped wrapper fixtures in conftest.py
+TOOLKIT_WRAPPER_FIXTURES = [
+    pytest.param("openeye_wrapper", marks=requires_openeye, id="openeye"),
+    pytest.param("rdkit_wrapper", marks=requires_rdkit, id="rdkit"),
+]
+
 # =============================================================================================
 # TESTS
 # =============================================================================================
 
 
+class TestCheminformaticsToolkitWrappers:
+    """Test behavior shared by the OpenEye and RDKit toolkit wrappers"""
+
+    @pytest.mark.parametrize("wrapper_fixture", TOOLKIT_WRAPPER_FIXTURES)
+    def test_from_bad_inchi(self, request, wrapper_fixture):
+        """Test building a molecule from a bad InChI string"""
+        toolkit_wrapper = request.getfixturevalue(wrapper_fixture)
+
+        inchi = "InChI=1S/ksbfksfksfksbfks"
+        with pytest.raises(RuntimeError):
+            mol = Molecule.from_inchi(inchi, toolkit_registry=toolkit_wrapper)
+
+    @pytest.mark.parametrize("wrapper_fixture", TOOLKIT_WRAPPER_FIXTURES)
+    def test_load_multiconformer_sdf_as_separate_molecules(
+        self, request, wrapper_fixture
+    ):
+        """
+        Test the toolkit wrappers for reading a "multiconformer" SDF, which the OFF
+        Toolkit should treat as separate molecules
+        """
+        toolkit_wrapper = request.getfixturevalue(wrapper_fixture)
+
+        filename = METHANE_MULTICONFORMER_SDF
+        molecules = Molecule.from_file(filename, toolkit_registry=toolkit_wrapper)
+        assert len(molecules) == 2
+        assert len(molecules[0].conformers) == 1
+        assert len(molecules[1].conformers) == 1
+        assert molecules[0].conformers[0].shape == (5, 3)
+
+    @pytest.mark.parametrize("wrapper_fixture", TOOLKIT_WRAPPER_FIXTURES)
+    def test_file_extension_case(self, request, wrapper_fixture):
+        """
+        Test round-trips of some file extensions when called directly from the toolkit wrappers,
+        including lower- and uppercase file extensions. Note that this test does not ensure
+        accuracy, it only tests that reading/writing without raising an exception.
+        """
+        toolkit_wrapper = request.getfixturevalue(wrapper_fixture)
+
+        mols_in = toolkit_wrapper.from_file(file_path=ETHANOL_SDF, file_format="sdf")
+
+        assert len(mols_in) > 0
+
+        mols_in = toolkit_wrapper.from_file(file_path=ETHANOL_SDF, file_format="SDF")
+
+        assert len(mols_in) > 0
+
+    @pytest.mark.parametrize("wrapper_fixture", TOOLKIT_WRAPPER_FIXTURES)
+    def test_generate_multiple_conformers(self, request, wrapper_fixture):
+        """Test generate_conformers() for generating multiple conformers"""
+        toolkit_wrapper = request.getfixturevalue(wrapper_fixture)
+
+        smiles = "CCCCCCC"
+        molecule = toolkit_wrapper.from_smiles(smiles)
+        molecule.generate_conformers(
+            rms_cutoff=1 * unit.angstrom,
+            n_conformers=100,
+            toolkit_registry=toolkit_wrapper,
+        )
+        assert molecule.n_conformers > 1
+        assert (molecule.conformers[0] / unit.angstrom).any()
+
+        # Ensure rms_cutoff kwarg is working
+        molecule2 = toolkit_wrapper.from_smiles(smiles)
+        molecule2.generate_conformers(
+            rms_cutoff=0.1 * unit.angstrom,
+            n_conformers=100,
+            toolkit_registry=toolkit_wrapper,
+        )
+        assert molecule2.n_conformers > molecule.n_conformers
+
+        # Ensure n_conformers kwarg is working
+        molecule2 = toolkit_wrapper.from_smiles(smiles)
+        molecule2.generate_conformers(
+            rms_cutoff=0.1 * unit.angstrom,
+            n_conformers=10,
+            toolkit_registry=toolkit_wrapper,
+        )
+        assert molecule2.n_conformers == 10
+
+    @pytest.mark.parametrize("wrapper_fixture", TOOLKIT_WRAPPER_FIXTURES)
+    def test_find_rotatable_bonds(self, request, wrapper_fixture, ethanol, cyclohexane):
+        """Test finding rotatable bonds while ignoring some groups"""
+        toolkit_wrapper = request.getfixturevalue(wrapper_fixture)
+
+        # test a simple molecule
+        bonds = ethanol.find_rotatable_bonds(toolkit_registry=toolkit_wrapper)
+        assert len(bonds) == 2
+        for bond in bonds:
+            assert ethanol.atoms[bond.atom1_index].atomic_number != 1
+            assert ethanol.atoms[bond.atom2_index].atomic_number != 1
+
+        # now ignore the C-O bond, forwards
+        bonds = ethanol.find_rotatable_bonds(
+            ignore_functional_groups=C_O_FORWARDS_SMARTS,
+            toolkit_registry=toolkit_wrapper,
+        )
+        assert len(bonds) == 1
+        assert ethanol.atoms[bonds[0].atom1_index].atomic_number == 6
+        assert ethanol.atoms[bonds[0].atom2_index].atomic_number == 6
+
+        # now ignore the O-C bond, backwards
+        bonds = ethanol.find_rotatable_bonds(
+            ignore_functional_groups=C_O_BACKWARDS_SMARTS,
+            toolkit_registry=toolkit_wrapper,
+        )
+        assert len(bonds) == 1
+        assert ethanol.atoms[bonds[0].atom1_index].atomic_number == 6
+        assert ethanol.atoms[bonds[0].atom2_index].atomic_number == 6
+
+        # now ignore the C-C bond
+        bonds = ethanol.find_rotatable_bonds(
+            ignore_functional_groups=C_C_SMARTS, toolkit_registry=toolkit_wrapper
+        )
+        assert len(bonds) == 1
+        assert ethanol.atoms[bonds[0].atom1_index].atomic_number == 6
+        assert ethanol.atoms[bonds[0].atom2_index].atomic_number == 8
+
+        # ignore a list of searches, forward
+        bonds = ethanol.find_rotatable_bonds(
+            ignore_functional_groups=[C_O_FORWARDS_SMARTS, C_C_SMARTS],
+            toolkit_registry=toolkit_wrapper,
+        )
+        assert bonds == []
+
+        # ignore a list of searches, backwards
+        bonds = ethanol.find_rotatable_bonds(
+            ignore_functional_groups=[C_C_SMARTS, C_O_BACKWARDS_SMARTS],
+            toolkit_registry=toolkit_wrapper,
+        )
+        assert bonds == []
+
+        # test  molecules that should have no rotatable bonds
+        bonds = cyclohexane.find_rotatable_bonds(toolkit_registry=toolkit_wrapper)
+        assert bonds == []
+
+        methane = Molecule.from_smiles("C", toolkit_registry=toolkit_wrapper)
+        bonds = methane.find_rotatable_bonds(toolkit_registry=toolkit_wrapper)
+        assert bonds == []
+
+        ethene = Molecule.from_smiles("C=C", toolkit_registry=toolkit_wrapper)
+        bonds = ethene.find_rotatable_bonds(toolkit_registry=toolkit_wrapper)
+        assert bonds == []
+
+        # test removing terminal rotors
+        toluene = Molecule.from_file(
+            TOLUENE_SDF,
+            toolkit_registry=toolkit_wrapper,
+        )
+        bonds = toluene.find_rotatable_bonds(toolkit_registry=toolkit_wrapper)
+        assert len(bonds) == 1
+        assert toluene.atoms[bonds[0].atom1_index].atomic_number == 6
+        assert toluene.atoms[bonds[0].atom2_index].atomic_number == 6
+
+        # find terminal bonds forward
+        bonds = toluene.find_rotatable_bonds(
+            ignore_functional_groups=TERMINAL_FORWARDS_SMARTS,
+            toolkit_registry=toolkit_wrapper,
+        )
+        assert bonds == []
+
+        # find terminal bonds backwards
+        bonds = toluene.find_rotatable_bonds(
+            ignore_functional_groups=TERMINAL_BACKWARDS_SMARTS,
+            toolkit_registry=toolkit_wrapper,
+        )
+        assert bonds == []
+
+
 @requires_openeye
 class TestOpenEyeToolkitWrapper:
     """Test the OpenEyeToolkitWrapper"""
 
     # TODO: Make separate smiles_add_H and smiles_explicit_H tests
 
-    def test_smiles(self):
+    def test_smiles(self, openeye_wrapper):
         """Test OpenEyeToolkitWrapper to_smiles() and from_smiles()"""
-        toolkit_wrapper = OpenEyeToolkitWrapper()
 
         # This differs from RDKit's SMILES due to different canonicalization schemes
 
         smiles = "[H]C([H])([H])C([H])([H])[H]"
-        molecule = Molecule.from_smiles(smiles, toolkit_registry=toolkit_wrapper)
+        molecule = Molecule.from_smiles(smiles, toolkit_registry=openeye_wrapper)
         # When creating an OFFMol from SMILES, partial charges should be initialized to None
         assert molecule.partial_charges is None
-        smiles2 = molecule.to_smiles(toolkit_registry=toolkit_wrapper)
+        smiles2 = molecule.to_smiles(toolkit_registry=openeye_wrapper)
         assert smiles == smiles2
 
-    def test_smiles_missing_stereochemistry(self):
-        """Test OpenEyeToolkitWrapper to_smiles() and from_smiles()"""
-        toolkit_wrapper = OpenEyeToolkitWrapper()
-
-        unspec_chiral_smiles = r"C\C(F)=C(/F)CC(C)(Cl)Br"
-        spec_chiral_smiles = r"C\C(F)=C(/F)C[C@@](C)(Cl)Br"
-        unspec_db_smiles = r"CC(F)=C(F)C[C@@](C)(Cl)Br"
-        spec_db_smiles = r"C\C(F)=C(/F)C[C@@](C)(Cl)Br"
-
-        for title, smiles, raises_exception in [
-            ("unspec_chiral_smiles", unspec_chiral_smiles, True),
-            ("spec_chiral_smiles", spec_chiral_smiles, False),
-            ("unspec_db_smiles", unspec_db_smiles, True),
-            ("spec_db_smiles", spec_db_smiles, False),
-        ]:
-            if raises_exception:
-                with pytest.raises(UndefinedStereochemistryError) as context:
-                    Molecule.from_smiles(smiles, toolkit_registry=toolkit_wrapper)
-                Molecule.from_smiles(
-                    smiles,
-                    toolkit_registry=toolkit_wrapper,
-                    allow_undefined_stereo=True,
-                )
-            else:
-                Molecule.from_smiles(smiles, toolkit_registry=toolkit_wrapper)
+    @pytest.mark.parametrize(
+        "smiles,raises_exception",
+        [
+            (r"C\C(F)=C(/F)CC(C)(Cl)Br", True),
+            (r"C\C(F)=C(/F)C[C@@](C)(Cl)Br", False),
+            (r"CC(F)=C(F)C[C@@](C)(Cl)Br", True),
+        ],
+        ids=["unspec_chiral_smiles", "spec_chiral_and_db_smiles", "unspec_db_smiles"],
+    )
+    def test_smiles_missing_stereochemistry(
+        self, openeye_wrapper, smiles, raises_exception
+    ):
+        """Test OpenEyeToolkitWrapper to_smiles() and from_smiles() when given ambiguous stereochemistry"""
+
+        if raises_exception:
+            with pytest.raises(UndefinedStereochemistryError):
+                Molecule.from_smiles(smiles, toolkit_registry=openeye_wrapper)
+            Molecule.from_smiles(
+                smiles, toolkit_registry=openeye_wrapper, allow_undefined_stereo=True
+            )
+        else:
+            Molecule.from_smiles(smiles, toolkit_registry=openeye_wrapper)
 
     # TODO: test_smiles_round_trip
 
-    def test_smiles_add_H(self):
+    def test_smiles_add_H(self, openeye_wrapper):
         """Test OpenEyeToolkitWrapper for adding explicit hydrogens"""
-        toolkit_wrapper = OpenEyeToolkitWrapper()
         # This differs from RDKit's SMILES due to different canonicalization schemes
         input_smiles = "CC"
         expected_output_smiles = "[H]C([H])([H])C([H])([H])[H]"
-        molecule = Molecule.from_smiles(input_smiles, toolkit_registry=toolkit_wrapper)
-        smiles2 = molecule.to_smiles(toolkit_registry=toolkit_wrapper)
+        molecule = Molecule.from_smiles(input_smiles, toolkit_registry=openeye_wrapper)
+        smiles2 = molecule.to_smiles(toolkit_registry=openeye_wrapper)
         assert expected_output_smiles == smiles2
 
-    def test_smiles_charged(self):
+    def test_smiles_charged(self, openeye_wrapper):
         """Test OpenEyeToolkitWrapper functions for reading/writing charged SMILES"""
-        toolkit_wrapper = OpenEyeToolkitWrapper()
         # This differs from RDKit's expected output due to different canonicalization schemes
         smiles = "[H]C([H])([H])[N+]([H])([H])[H]"
-        molecule = Molecule.from_smiles(smiles, toolkit_registry=toolkit_wrapper)
-        smiles2 = molecule.to_smiles(toolkit_registry=toolkit_wrapper)
+        molecule = Molecule.from_smiles(smiles, toolkit_registry=openeye_wrapper)
+        smiles2 = molecule.to_smiles(toolkit_registry=openeye_wrapper)
         assert smiles == smiles2
 
-    def test_to_from_openeye_core_props_filled(self):
+    def test_to_from_openeye_core_props_filled(self, openeye_wrapper):
         """Test OpenEyeToolkitWrapper to_openeye() and from_openeye()"""
-        toolkit_wrapper = OpenEyeToolkitWrapper()
 
         # Replacing with a simple molecule with stereochemistry
         input_smiles = r"C\C(F)=C(/F)C[C@@](C)(Cl)Br"
         expected_output_smiles = (
             r"[H]C([H])([H])/C(=C(/C([H])([H])[C@@](C([H])([H])[H])(Cl)Br)\F)/F"
         )
-        molecule = Molecule.from_smiles(input_smiles, toolkit_registry=toolkit_wrapper)
+        molecule = Molecule.from_smiles(input_smiles, toolkit_registry=openeye_wrapper)
         assert (
-            molecule.to_smiles(toolkit_registry=toolkit_wrapper)
+            molecule.to_smiles(toolkit_registry=openeye_wrapper)
             == expected_output_smiles
         )
 
@@ -315,77 +545,55 @@ class TestOpenEyeToolkitWrapper:
             unit.elementary_charge,
         )
         molecule.partial_charges = partial_charges
-        coords = unit.Quantity(
-            np.array(
-                [
-                    ["0.0", "1.0", "2.0"],
-                    ["3.0", "4.0", "5.0"],
-                    ["6.0", "7.0", "8.0"],
-                    ["9.0", "10.0", "11.0"],
-                    ["12.0", "13.0", "14.0"],
-                    ["15.0", "16.0", "17.0"],
-                    ["18.0", "19.0", "20.0"],
-                    ["21.0", "22.0", "23.0"],
-                    ["24.0", "25.0", "26.0"],
-                    ["27.0", "28.0", "29.0"],
-                    ["30.0", "31.0", "32.0"],
-                    ["33.0", "34.0", "35.0"],
-                    ["36.0", "37.0", "38.0"],
-                    ["39.0", "40.0", "41.0"],
-                    ["42.0", "43.0", "44.0"],
-                    ["45.0", "46.0", "47.0"],
-                    ["48.0", "49.0", "50.0"],
-                    ["51.0", "52.0", "53.0"],
-                ]
-            ),
-            unit.angstrom,
-        )
+        coords = unit.Quantity(np.arange(54, dtype=float).reshape(18, 3), unit.angstrom)
         molecule.add_conformer(coords)
         # Populate core atom property fields
         molecule.atoms[2].name = "Bob"
         # Ensure one atom has its stereochemistry specified
-        central_carbon_stereo_specified = False
-        for atom in molecule.atoms:
-            if (atom.atomic_number == 6) and atom.stereochemistry == "S":
-                central_carbon_stereo_specified = True
-        assert central_carbon_stereo_specified
+        assert any(
+            (atom.atomic_number == 6) and atom.stereochemistry == "S"
+            for atom in molecule.atoms
+        )
 
         # Populate bond core property fields
-        fractional_bond_orders = [float(val) for val in range(1, 19)]
+        fractional_bond_orders = np.arange(1.0, 19.0).tolist()
         for fbo, bond in zip(fractional_bond_orders, molecule.bonds):
             bond.fractional_bond_order = fbo
 
-        # Do a first conversion to/from oemol
+        # Do a first conversion to/from oemol. to_openeye() has already assigned
+        # MDL aromaticity, so there is no need to perceive it again
         oemol = molecule.to_openeye()
-        molecule2 = Molecule.from_openeye(oemol)
+        molecule2 = Molecule.from_openeye(oemol, perceive_aromaticity=False)
 
         # Test that properties survived first conversion
         # assert molecule.to_dict() == molecule2.to_dict()
         assert molecule.name == molecule2.name
         # NOTE: This expects the same indexing scheme in the original and new molecule
 
-        central_carbon_stereo_specified = False
-        for atom in molecule2.atoms:
-            if (atom.atomic_number == 6) and atom.stereochemistry == "S":
-                central_carbon_stereo_specified = True
-        assert central_carbon_stereo_specified
+        assert any(
+            (atom.atomic_number == 6) and atom.stereochemistry == "S"
+            for atom in molecule2.atoms
+        )
         for atom1, atom2 in zip(molecule.atoms, molecule2.atoms):
             assert atom1.to_dict() == atom2.to_dict()
         for bond1, bond2 in zip(molecule.bonds, molecule2.bonds):
             assert bond1.to_dict() == bond2.to_dict()
-        assert (molecule.conformers[0] == molecule2.conformers[0]).all()
-        for pc1, pc2 in zip(molecule._partial_charges, molecule2._partial_charges):
-            pc1_ul = pc1 / unit.elementary_charge
-            pc2_ul = pc2 / unit.elementary_charge
-            assert_almost_equal(pc1_ul, pc2_ul, decimal=6)
+        assert np.array_equal(
+            molecule.conformers[0] / unit.angstrom,
+            molecule2.conformers[0] / unit.angstrom,
+        )
+        np.testing.assert_allclose(
+            molecule._partial_charges / unit.elementary_charge,
+            molecule2._partial_charges / unit.elementary_charge,
+            atol=1.0e-6,
+        )
         assert (
-            molecule2.to_smiles(toolkit_registry=toolkit_wrapper)
+            molecule2.to_smiles(toolkit_registry=openeye_wrapper)
             == expected_output_smiles
         )
 
-    def test_to_from_openeye_core_props_unset(self):
+    def test_to_from_openeye_core_props_unset(self, openeye_wrapper):
         """Test OpenEyeToolkitWrapper to_openeye() and from_openeye() when given empty core property fields"""
-        toolkit_wrapper = OpenEyeToolkitWrapper()
 
         # Using a simple molecule with tetrahedral and bond stereochemistry
         input_smiles = r"C\C(F)=C(/F)C[C@](C)(Cl)Br"
@@ -393,32 +601,31 @@ class TestOpenEyeToolkitWrapper:
         expected_output_smiles = (
             r"[H]C([H])([H])/C(=C(/C([H])([H])[C@](C([H])([H])[H])(Cl)Br)\F)/F"
         )
-        molecule = Molecule.from_smiles(input_smiles, toolkit_registry=toolkit_wrapper)
+        molecule = Molecule.from_smiles(input_smiles, toolkit_registry=openeye_wrapper)
         assert (
-            molecule.to_smiles(toolkit_registry=toolkit_wrapper)
+            molecule.to_smiles(toolkit_registry=openeye_wrapper)
             == expected_output_smiles
         )
 
         # Ensure one atom has its stereochemistry specified
-        central_carbon_stereo_specified = False
-        for atom in molecule.atoms:
-            if (atom.atomic_number == 6) and atom.stereochemistry == "R":
-                central_carbon_stereo_specified = True
-        assert central_carbon_stereo_specified
+        assert any(
+            (atom.atomic_number == 6) and atom.stereochemistry == "R"
+            for atom in molecule.atoms
+        )
 
-        # Do a first conversion to/from oemol
+        # Do a first conversion to/from oemol. to_openeye() has already assigned
+        # MDL aromaticity, so there is no need to perceive it again
         oemol = molecule.to_openeye()
-        molecule2 = Molecule.from_openeye(oemol)
+        molecule2 = Molecule.from_openeye(oemol, perceive_aromaticity=False)
 
         # Test that properties survived first conversion
         assert molecule.name == molecule2.name
         # NOTE: This expects the same indexing scheme in the original and new molecule
 
-        central_carbon_stereo_specified = False
-        for atom in molecule2.atoms:
-            if (atom.atomic_number == 6) and atom.stereochemistry == "R":
-                central_carbon_stereo_specified = True
-        assert central_carbon_stereo_specified
+        assert any(
+            (atom.atomic_number == 6) and atom.stereochemistry == "R"
+            for atom in molecule2.atoms
+        )
         for atom1, atom2 in zip(molecule.atoms, molecule2.atoms):
             assert atom1.to_dict() == atom2.to_dict()
         for bond1, bond2 in zip(molecule.bonds, molecule2.bonds):
@@ -431,31 +638,30 @@ class TestOpenEyeToolkitWrapper:
         assert molecule2.partial_charges is None
 
         assert (
-            molecule2.to_smiles(toolkit_registry=toolkit_wrapper)
+            molecule2.to_smiles(toolkit_registry=openeye_wrapper)
             == expected_output_smiles
         )
 
-    def test_to_from_openeye_none_partial_charges(self):
+    def test_to_from_openeye_none_partial_charges(self, ethanol):
         """Test to ensure that to_openeye and from_openeye correctly handle None partial charges"""
-        import math
-
         # Create ethanol, which has partial charges defined with float values
-        ethanol = create_ethanol()
         assert ethanol.partial_charges is not None
         # Convert to OEMol, which should populate the partial charges on
         # the OEAtoms with the same partial charges
         oemol = ethanol.to_openeye()
-        for oeatom in oemol.GetAtoms():
-            assert not math.isnan(oeatom.GetPartialCharge())
+        oe_charges = np.array(
+            [oeatom.GetPartialCharge() for oeatom in oemol.GetAtoms()]
+        )
+        assert not np.isnan(oe_charges).any()
         # Change the first OEAtom's partial charge to nan, and ensure that it comes
         # back to OFFMol with only the first atom as nan
         for oeatom in oemol.GetAtoms():
             oeatom.SetPartialCharge(float("nan"))
             break
         eth_from_oe = Molecule.from_openeye(oemol)
-        assert math.isnan(eth_from_oe.partial_charges[0] / unit.elementary_charge)
-        for pc in eth_from_oe.partial_charges[1:]:
-            assert not math.isnan(pc / unit.elementary_charge)
+        charges = eth_from_oe.partial_charges / unit.elementary_charge
+        assert np.isnan(charges[0])
+        assert not np.isnan(charges[1:]).any()
         # Then, set all the OEMol's partial charges to nan, and ensure that
         # from_openeye produces an OFFMol with partial_charges = None
         for oeatom in oemol.GetAtoms():
@@ -466,8 +672,10 @@ class TestOpenEyeToolkitWrapper:
         # Send the OFFMol with partial_charges = None back to OEMol, and
         # ensure that all its charges are nan
         oemol2 = eth_from_oe.to_openeye()
-        for oeatom in oemol2.GetAtoms():
-            assert math.isnan(oeatom.GetPartialCharge())
+        oe_charges = np.array(
+            [oeatom.GetPartialCharge() for oeatom in oemol2.GetAtoms()]
+        )
+        assert np.isnan(oe_charges).all()
 
     def test_from_openeye_implicit_hydrogen(self):
         """
@@ -489,12 +697,32 @@ class TestOpenEyeToolkitWrapper:
         molecule_from_expl = Molecule.from_openeye(oemol_expl)
         assert molecule_from_expl.to_smiles() == molecule_from_impl.to_smiles()
 
-    def test_openeye_from_smiles_hydrogens_are_explicit(self):
+    def test_from_openeye_perceive_aromaticity(self):
+        """
+        Test OpenEyeToolkitWrapper from_openeye() only assigns aromaticity when
+        perceive_aromaticity is True
+        """
+        from openeye import oechem
+
+        # OEParseSmiles leaves the Kekule structure without aromaticity flags
+        oemol = oechem.OEMol()
+        oechem.OEParseSmiles(oemol, "C1=CC=CC=C1")
+
+        molecule = Molecule.from_openeye(oechem.OEMol(oemol))
+        unperceived = Molecule.from_openeye(
+            oechem.OEMol(oemol), perceive_aromaticity=False
+        )
+
+        carbons = [atom for atom in molecule.atoms if atom.atomic_number == 6]
+        assert all(atom.is_aromatic for atom in carbons)
+        assert not any(atom.is_aromatic for atom in unperceived.atoms)
+        assert not any(bond.is_aromatic for bond in unperceived.bonds)
+
+    def test_openeye_from_smiles_hydrogens_are_explicit(self, openeye_wrapper):
         """
         Test to ensure that OpenEyeToolkitWrapper.from_smiles has the proper behavior with
         respect to its hydrogens_are_explicit kwarg
         """
-        toolkit_wrapper = OpenEyeToolkitWrapper()
         smiles_impl = "C#C"
         with pytest.raises(
             ValueError,
@@ -502,17 +730,17 @@ class TestOpenEyeToolkitWrapper:
         ) as excinfo:
             offmol = Molecule.from_smiles(
                 smiles_impl,
-                toolkit_registry=toolkit_wrapper,
+                toolkit_registry=openeye_wrapper,
                 hydrogens_are_explicit=True,
             )
         offmol = Molecule.from_smiles(
-            smiles_impl, toolkit_registry=toolkit_wrapper, hydrogens_are_explicit=False
+            smiles_impl, toolkit_registry=openeye_wrapper, hydrogens_are_explicit=False
         )
         assert offmol.n_atoms == 4
 
         smiles_expl = "HC#CH"
         offmol = Molecule.from_smiles(
-            smiles_expl, toolkit_registry=toolkit_wrapper, hydrogens_are_explicit=True
+            smiles_expl, toolkit_registry=openeye_wrapper, hydrogens_are_explicit=True
         )
         assert offmol.n_atoms == 4
         # It's debatable whether this next function should pass. Strictly speaking, the hydrogens in this SMILES
@@ -520,52 +748,43 @@ class TestOpenEyeToolkitWrapper:
         # We might rethink the name of this kwarg.
 
         offmol = Molecule.from_smiles(
-            smiles_expl, toolkit_registry=toolkit_wrapper, hydrogens_are_explicit=False
+            smiles_expl, toolkit_registry=openeye_wrapper, hydrogens_are_explicit=False
         )
         assert offmol.n_atoms == 4
 
     @pytest.mark.parametrize("molecule", get_mini_drug_bank(OpenEyeToolkitWrapper))
-    def test_to_inchi(self, molecule):
+    def test_to_inchi(self, openeye_wrapper, molecule):
         """Test conversion to standard and non-standard InChI"""
 
-        toolkit = OpenEyeToolkitWrapper()
-        inchi = molecule.to_inchi(toolkit_registry=toolkit)
-        non_standard = molecule.to_inchi(True, toolkit_registry=toolkit)
+        inchi = molecule.to_inchi(toolkit_registry=openeye_wrapper)
+        non_standard = molecule.to_inchi(True, toolkit_registry=openeye_wrapper)
 
     @pytest.mark.parametrize("molecule", get_mini_drug_bank(OpenEyeToolkitWrapper))
-    def test_to_inchikey(self, molecule):
+    def test_to_inchikey(self, openeye_wrapper, molecule):
         """Test the conversion to standard and non-standard InChIKey"""
 
-        toolkit = OpenEyeToolkitWrapper()
-        inchikey = molecule.to_inchikey(toolkit_registry=toolkit)
-        non_standard_key = molecule.to_inchikey(True, toolkit_registry=toolkit)
-
-    def test_from_bad_inchi(self):
-        """Test building a molecule from a bad InChI string"""
-
-        toolkit = OpenEyeToolkitWrapper()
-        inchi = "InChI=1S/ksbfksfksfksbfks"
-        with pytest.raises(RuntimeError):
-            mol = Molecule.from_inchi(inchi, toolkit_registry=toolkit)
+        inchikey = molecule.to_inchikey(toolkit_registry=openeye_wrapper)
+        non_standard_key = molecule.to_inchikey(True, toolkit_registry=openeye_wrapper)
 
     @pytest.mark.parametrize("molecule", get_mini_drug_bank(OpenEyeToolkitWrapper))
-    def test_non_standard_inchi_round_trip(self, molecule):
+    def test_non_standard_inchi_round_trip(self, openeye_wrapper, molecule):
         """Test if a molecule can survive an InChi round trip test in some cases the standard InChI
         will not enough to ensure information is preserved so we test the non-standard inchi here."""
 
         from openforcefield.utils.toolkits import UndefinedStereochemistryError
 
-        toolkit = OpenEyeToolkitWrapper()
-        inchi = molecule.to_inchi(fixed_hydrogens=True, toolkit_registry=toolkit)
+        inchi = molecule.to_inchi(
+            fixed_hydrogens=True, toolkit_registry=openeye_wrapper
+        )
         # make a copy of the molecule from the inchi string
         if molecule.name in openeye_inchi_stereochemistry_lost:
             # some molecules lose sterorchemsitry so they are skipped
             # if we fail here the molecule may of been fixed
             with pytest.raises(UndefinedStereochemistryError):
-                mol2 = molecule.from_inchi(inchi, toolkit_registry=toolkit)
+                mol2 = molecule.from_inchi(inchi, toolkit_registry=openeye_wrapper)
 
         else:
-            mol2 = molecule.from_inchi(inchi, toolkit_registry=toolkit)
+            mol2 = molecule.from_inchi(inchi, toolkit_registry=openeye_wrapper)
             # compare the full molecule excluding the properties dictionary
             # turn of the bond order matching as this could move in the aromatic rings
             if molecule.name in openeye_inchi_isomorphic_fails:
@@ -573,35 +792,37 @@ class TestOpenEyeToolkitWrapper:
                 # we test quite strict isomorphism here
                 with pytest.raises(AssertionError):
                     assert molecule.is_isomorphic_with(
-                        mol2, bond_order_matching=False, toolkit_registry=toolkit
+                        mol2,
+                        bond_order_matching=False,
+                        toolkit_registry=openeye_wrapper,
                     )
             else:
                 assert molecule.is_isomorphic_with(
-                    mol2, bond_order_matching=False, toolkit_registry=toolkit
+                    mol2, bond_order_matching=False, toolkit_registry=openeye_wrapper
                 )
 
-    def test_write_multiconformer_pdb(self):
+    def test_write_multiconformer_pdb(self, openeye_wrapper):
         """
         Make sure OpenEye can write multi conformer PDB files.
         """
         from io import StringIO
 
-        toolkit = OpenEyeToolkitWrapper()
         # load up a multiconformer sdf file and condense down the conformers
         molecules = Molecule.from_file(
-            get_data_file_path("molecules/butane_multi.sdf"), toolkit_registry=toolkit
+            BUTANE_MULTI_SDF,
+            toolkit_registry=openeye_wrapper,
         )
         butane = molecules.pop(0)
         for mol in molecules:
             butane.add_conformer(mol.conformers[0])
         assert butane.n_conformers == 7
         sio = StringIO()
-        butane.to_file(sio, "pdb", toolkit_registry=toolkit)
+        butane.to_file(sio, "pdb", toolkit_registry=openeye_wrapper)
         # we need to make sure each conformer is wrote to the file
         pdb = sio.getvalue()
         assert pdb.count("END") == 7
 
-    def test_write_pdb_preserving_atom_order(self):
+    def test_write_pdb_preserving_atom_order(self, openeye_wrapper):
         """
         Make sure OpenEye does not rearrange hydrogens when writing PDBs
         (reference: https://github.com/openforcefield/openforcefield/issues/475).
@@ -610,7 +831,6 @@ class TestOpenEyeToolkitWrapper:
 
         from openeye import oechem
 
-        toolkit = OpenEyeToolkitWrapper()
         water = Molecule()
         water.add_atom(1, 0, False)
         water.add_atom(8, 0, False)
@@ -622,44 +842,28 @@ class TestOpenEyeToolkitWrapper:
             * unit.angstrom
         )
         sio = StringIO()
-        water.to_file(sio, "pdb", toolkit_registry=toolkit)
+        water.to_file(sio, "pdb", toolkit_registry=openeye_wrapper)
         water_from_pdb = sio.getvalue()
         water_from_pdb_split = water_from_pdb.split("\n")
         assert water_from_pdb_split[0].split()[2].rstrip() == "H"
         assert water_from_pdb_split[1].split()[2].rstrip() == "O"
         assert water_from_pdb_split[2].split()[2].rstrip() == "H"
 
-    def test_get_sdf_coordinates(self):
+    def test_get_sdf_coordinates(self, toluene_mol):
         """Test OpenEyeToolkitWrapper for importing a single set of coordinates from a sdf file"""
+        assert len(toluene_mol.conformers) == 1
+        assert toluene_mol.conformers[0].shape == (15, 3)
 
-        toolkit_wrapper = OpenEyeToolkitWrapper()
-        filename = get_data_file_path("molecules/toluene.sdf")
-        molecule = Molecule.from_file(filename, toolkit_registry=toolkit_wrapper)
-        assert len(molecule.conformers) == 1
-        assert molecule.conformers[0].shape == (15, 3)
-
-    def test_load_multiconformer_sdf_as_separate_molecules(self):
-        """
-        Test OpenEyeToolkitWrapper for reading a "multiconformer" SDF, which the OFF
-        Toolkit should treat as separate molecules
-        """
-        toolkit_wrapper = OpenEyeToolkitWrapper()
-        filename = get_data_file_path("molecules/methane_multiconformer.sdf")
-        molecules = Molecule.from_file(filename, toolkit_registry=toolkit_wrapper)
-        assert len(molecules) == 2
-        assert len(molecules[0].conformers) == 1
-        assert len(molecules[1].conformers) == 1
-        assert molecules[0].conformers[0].shape == (5, 3)
-
-    def test_load_multiconformer_sdf_as_separate_molecules_properties(self):
+    def test_load_multiconformer_sdf_as_separate_molecules_properties(
+        self, openeye_wrapper
+    ):
         """
         Test OpenEyeToolkitWrapper for reading a "multiconformer" SDF, which the OFF
         Toolkit should treat as separate molecules, and it should load their SD properties
         and partial charges separately
         """
-        toolkit_wrapper = OpenEyeToolkitWrapper()
-        filename = get_data_file_path("molecules/methane_multiconformer_properties.sdf")
-        molecules = Molecule.from_file(filename, toolkit_registry=toolkit_wrapper)
+        filename = METHANE_MULTICONFORMER_PROPERTIES_SDF
+        molecules = Molecule.from_file(filename, toolkit_registry=openeye_wrapper)
         assert len(molecules) == 2
         assert len(molecules[0].conformers) == 1
         assert len(molecules[1].conformers) == 1
@@ -681,84 +885,54 @@ class TestOpenEyeToolkitWrapper:
             [0.027170, 0.027170, 0.027170, 0.027170, -0.108680],
         )
 
-    @requires_openeye
-    def test_file_extension_case(self):
-        """
-        Test round-trips of some file extensions when called directly from the toolkit wrappers,
-        including lower- and uppercase file extensions. Note that this test does not ensure
-        accuracy, it only tests that reading/writing without raising an exception.
-        """
-        mols_in = OpenEyeToolkitWrapper().from_file(
-            file_path=get_data_file_path("molecules/ethanol.sdf"), file_format="sdf"
-        )
-
-        assert len(mols_in) > 0
-
-        mols_in = OpenEyeToolkitWrapper().from_file(
-            file_path=get_data_file_path("molecules/ethanol.sdf"), file_format="SDF"
-        )
-
-        assert len(mols_in) > 0
-
-    def test_write_sdf_charges(self):
+    def test_write_sdf_charges(self, openeye_wrapper, ethanol):
         """Test OpenEyeToolkitWrapper for writing partial charges to a sdf file"""
         from io import StringIO
 
-        toolkit_wrapper = OpenEyeToolkitWrapper()
-        ethanol = create_ethanol()
         sio = StringIO()
-        ethanol.to_file(sio, "SDF", toolkit_registry=toolkit_wrapper)
+        ethanol.to_file(sio, "SDF", toolkit_registry=openeye_wrapper)
         sdf_text = sio.getvalue()
         # The output lines of interest here will look like
         # > <atom.dprop.PartialCharge>
         # -0.400000 -0.300000 -0.200000 -0.100000 0.000010 0.100000 0.200000 0.300000 0.400000
-        # Parse the SDF text, grabbing the numeric line above
-        sdf_split = sdf_text.split("\n")
-        charge_line_found = False
-        for line in sdf_split:
-            if charge_line_found:
-                charges = [float(i) for i in line.split()]
-                break
-            if "> <atom.dprop.PartialCharge>" in line:
-                charge_line_found = True
+        # Grab the numeric line above from the SDF text
+        match = _CHARGE_RE.search(sdf_text)
 
         # Make sure that a charge line was ever found
-        assert charge_line_found == True
+        assert match is not None
+        charges = [float(i) for i in match.group(1).split()]
 
         # Make sure that the charges found were correct
         assert_almost_equal(
             charges, [-0.4, -0.3, -0.2, -0.1, 0.00001, 0.1, 0.2, 0.3, 0.4]
         )
 
-    def test_write_sdf_no_charges(self):
+    def test_write_sdf_no_charges(self, openeye_wrapper, ethanol):
         """Test OpenEyeToolkitWrapper for writing an SDF file without charges"""
         from io import StringIO
 
-        toolkit_wrapper = OpenEyeToolkitWrapper()
-        ethanol = create_ethanol()
         ethanol.partial_charges = None
         sio = StringIO()
-        ethanol.to_file(sio, "SDF", toolkit_registry=toolkit_wrapper)
+        ethanol.to_file(sio, "SDF", toolkit_registry=openeye_wrapper)
         sdf_text = sio.getvalue()
         # In our current configuration, if the OFFMol doesn't have partial charges, we DO NOT want a partial charge
         # block to be written. For reference, it's possible to indicate that a partial charge is not known by writing
         # out "n/a" (or another placeholder) in the partial charge block atoms without charges.
         assert "<atom.dprop.PartialCharge>" not in sdf_text
 
-    def test_sdf_properties_roundtrip(self):
+    def test_sdf_properties_roundtrip(self, openeye_wrapper, ethanol):
         """Test OpenEyeToolkitWrapper for performing a round trip of a molecule with defined partial charges
         and entries in the properties dict to and from a sdf file"""
-        toolkit_wrapper = OpenEyeToolkitWrapper()
-        ethanol = create_ethanol()
+        from io import StringIO
+
         ethanol.properties["test_property"] = "test_value"
-        # Write ethanol to a temporary file, and then immediately read it.
-        with NamedTemporaryFile(suffix=".sdf") as iofile:
-            ethanol.to_file(
-                iofile.name, file_format="SDF", toolkit_registry=toolkit_wrapper
-            )
-            ethanol2 = Molecule.from_file(
-                iofile.name, file_format="SDF", toolkit_registry=toolkit_wrapper
-            )
+        # Write ethanol to an in-memory SDF, and then immediately read it.
+        sio = StringIO()
+        ethanol.to_file(sio, file_format="SDF", toolkit_registry=openeye_wrapper)
+        sio.seek(0)
+        ethanol2 = Molecule.from_file(
+            sio, file_format="SDF", toolkit_registry=openeye_wrapper
+        )
         np.testing.assert_allclose(
             ethanol.partial_charges / unit.elementary_charge,
             ethanol2.partial_charges / unit.elementary_charge,
@@ -768,27 +942,25 @@ class TestOpenEyeToolkitWrapper:
         # Now test with no properties or charges
         ethanol = create_ethanol()
         ethanol.partial_charges = None
-        # Write ethanol to a temporary file, and then immediately read it.
-        with NamedTemporaryFile(suffix=".sdf") as iofile:
-            ethanol.to_file(
-                iofile.name, file_format="SDF", toolkit_registry=toolkit_wrapper
-            )
-            ethanol2 = Molecule.from_file(
-                iofile.name, file_format="SDF", toolkit_registry=toolkit_wrapper
-            )
+        # Write ethanol to an in-memory SDF, and then immediately read it.
+        sio = StringIO()
+        ethanol.to_file(sio, file_format="SDF", toolkit_registry=openeye_wrapper)
+        sio.seek(0)
+        ethanol2 = Molecule.from_file(
+            sio, file_format="SDF", toolkit_registry=openeye_wrapper
+        )
         assert ethanol2.partial_charges is None
         assert ethanol2.properties == {}
 
-    def test_write_multiconformer_mol_as_sdf(self):
+    def test_write_multiconformer_mol_as_sdf(self, openeye_wrapper):
         """
         Test OpenEyeToolkitWrapper for writing a multiconformer molecule to SDF. The OFF toolkit should only
         save the first conformer.
         """
         from io import StringIO
 
-        toolkit_wrapper = OpenEyeToolkitWrapper()
-        filename = get_data_file_path("molecules/ethanol.sdf")
-        ethanol = Molecule.from_file(filename, toolkit_registry=toolkit_wrapper)
+        filename = ETHANOL_SDF
+        ethanol = Molecule.from_file(filename, toolkit_registry=openeye_wrapper)
         ethanol.partial_charges = (
             np.array([-4.0, -3.0, -2.0, -1.0, 0.0, 1.0, 2.0, 3.0, 4.0])
             * unit.elementary_charge
@@ -799,7 +971,7 @@ class TestOpenEyeToolkitWrapper:
         )
         ethanol.add_conformer(new_conf)
         sio = StringIO()
-        ethanol.to_file(sio, "sdf", toolkit_registry=toolkit_wrapper)
+        ethanol.to_file(sio, "sdf", toolkit_registry=openeye_wrapper)
         data = sio.getvalue()
         # In SD format, each molecule ends with "$$$$"
         assert data.count("$$$$") == 1
@@ -814,11 +986,10 @@ class TestOpenEyeToolkitWrapper:
             str(ethanol.conformers[1][0][0].in_units_of(unit.angstrom))[:5] not in data
         )
 
-    def test_get_mol2_coordinates(self):
+    def test_get_mol2_coordinates(self, openeye_wrapper):
         """Test OpenEyeToolkitWrapper for importing a single set of molecule coordinates"""
-        toolkit_wrapper = OpenEyeToolkitWrapper()
-        filename = get_data_file_path("molecules/toluene.mol2")
-        molecule1 = Molecule.from_file(filename, toolkit_registry=toolkit_wrapper)
+        filename = TOLUENE_MOL2
+        molecule1 = Molecule.from_file(filename, toolkit_registry=openeye_wrapper)
         assert len(molecule1.conformers) == 1
         assert molecule1.conformers[0].shape == (15, 3)
         assert_almost_equal(
@@ -828,7 +999,7 @@ class TestOpenEyeToolkitWrapper:
         # Test loading from file-like object
         with open(filename, "r") as infile:
             molecule2 = Molecule(
-                infile, file_format="MOL2", toolkit_registry=toolkit_wrapper
+                infile, file_format="MOL2", toolkit_registry=openeye_wrapper
             )
         assert molecule1.is_isomorphic_with(molecule2)
         assert len(molecule2.conformers) == 1
@@ -842,7 +1013,7 @@ class TestOpenEyeToolkitWrapper:
 
         with gzip.GzipFile(filename + ".gz", "r") as infile:
             molecule3 = Molecule(
-                infile, file_format="MOL2", toolkit_registry=toolkit_wrapper
+                infile, file_format="MOL2", toolkit_registry=openeye_wrapper
             )
         assert molecule1.is_isomorphic_with(molecule3)
         assert len(molecule3.conformers) == 1
@@ -851,11 +1022,10 @@ class TestOpenEyeToolkitWrapper:
             molecule3.conformers[0][5][1] / unit.angstrom, 22.98, decimal=2
         )
 
-    def test_get_mol2_charges(self):
+    def test_get_mol2_charges(self, openeye_wrapper):
         """Test OpenEyeToolkitWrapper for importing a mol2 file specifying partial charges"""
-        toolkit_wrapper = OpenEyeToolkitWrapper()
-        filename = get_data_file_path("molecules/toluene_charged.mol2")
-        molecule = Molecule.from_file(filename, toolkit_registry=toolkit_wrapper)
+        filename = TOLUENE_CHARGED_MOL2
+        molecule = Molecule.from_file(filename, toolkit_registry=openeye_wrapper)
         assert len(molecule.conformers) == 1
         assert molecule.conformers[0].shape == (15, 3)
         target_charges = unit.Quantity(
@@ -880,27 +1050,24 @@ class TestOpenEyeToolkitWrapper:
             ),
             unit.elementary_charge,
         )
-        for pc1, pc2 in zip(molecule._partial_charges, target_charges):
-            pc1_ul = pc1 / unit.elementary_charge
-            pc2_ul = pc2 / unit.elementary_charge
-            assert_almost_equal(pc1_ul, pc2_ul, decimal=4)
+        np.testing.assert_allclose(
+            molecule._partial_charges / unit.elementary_charge,
+            target_charges / unit.elementary_charge,
+            atol=1.0e-4,
+        )
 
-    def test_mol2_charges_roundtrip(self):
+    def test_mol2_charges_roundtrip(self, openeye_wrapper, ethanol, tmp_path):
         """Test OpenEyeToolkitWrapper for performing a round trip of a molecule with partial charge to and from
         a mol2 file"""
-        toolkit_wrapper = OpenEyeToolkitWrapper()
-        ethanol = create_ethanol()
         # we increase the magnitude of the partial charges here, since mol2 is only
         # written to 4 digits of precision, and the default middle charge for our test ethanol is 1e-5
         ethanol.partial_charges *= 100
         # Write ethanol to a temporary file, and then immediately read it.
-        with NamedTemporaryFile(suffix=".mol2") as iofile:
-            ethanol.to_file(
-                iofile.name, file_format="mol2", toolkit_registry=toolkit_wrapper
-            )
-            ethanol2 = Molecule.from_file(
-                iofile.name, file_format="mol2", toolkit_registry=toolkit_wrapper
-            )
+        iofile = str(tmp_path / "ethanol.mol2")
+        ethanol.to_file(iofile, file_format="mol2", toolkit_registry=openeye_wrapper)
+        ethanol2 = Molecule.from_file(
+            iofile, file_format="mol2", toolkit_registry=openeye_wrapper
+        )
         np.testing.assert_allclose(
             ethanol.partial_charges / unit.elementary_charge,
             ethanol2.partial_charges / unit.elementary_charge,
@@ -910,146 +1077,94 @@ class TestOpenEyeToolkitWrapper:
         ethanol = create_ethanol()
         ethanol.partial_charges = None
         # Write ethanol to a temporary file, and then immediately read it.
-        with NamedTemporaryFile(suffix=".mol2") as iofile:
-            ethanol.to_file(
-                iofile.name, file_format="mol2", toolkit_registry=toolkit_wrapper
-            )
-            ethanol2 = Molecule.from_file(
-                iofile.name, file_format="mol2", toolkit_registry=toolkit_wrapper
-            )
+        iofile = str(tmp_path / "ethanol_no_charges.mol2")
+        ethanol.to_file(iofile, file_format="mol2", toolkit_registry=openeye_wrapper)
+        ethanol2 = Molecule.from_file(
+            iofile, file_format="mol2", toolkit_registry=openeye_wrapper
+        )
         assert ethanol2.partial_charges is None
         assert ethanol2.properties == {}
 
-    def test_get_mol2_gaff_atom_types(self):
+    def test_get_mol2_gaff_atom_types(self, openeye_wrapper):
         """Test that a warning is raised OpenEyeToolkitWrapper when it detects GAFF atom types in a mol2 file."""
-        toolkit_wrapper = OpenEyeToolkitWrapper()
-        mol2_file_path = get_data_file_path("molecules/AlkEthOH_test_filt1_ff.mol2")
+        mol2_file_path = ALKETHOH_MOL2
         with pytest.warns(GAFFAtomTypeWarning, match="SYBYL"):
-            Molecule.from_file(mol2_file_path, toolkit_registry=toolkit_wrapper)
+            Molecule.from_file(mol2_file_path, toolkit_registry=openeye_wrapper)
 
-    def test_generate_conformers(self):
+    def test_generate_conformers(self, openeye_wrapper):
         """Test OpenEyeToolkitWrapper generate_conformers()"""
-        toolkit_wrapper = OpenEyeToolkitWrapper()
         smiles = "[H]C([H])([H])C([H])([H])[H]"
-        molecule = toolkit_wrapper.from_smiles(smiles)
-        molecule.generate_conformers()
+        molecule = openeye_wrapper.from_smiles(smiles)
+        molecule.generate_conformers(toolkit_registry=openeye_wrapper)
         assert molecule.n_conformers != 0
-        assert not (molecule.conformers[0] == (0.0 * unit.angstrom)).all()
-
-    def test_generate_multiple_conformers(self):
-        """Test OpenEyeToolkitWrapper generate_conformers() for generating multiple conformers"""
-        toolkit_wrapper = OpenEyeToolkitWrapper()
-        smiles = "CCCCCCC"
-        molecule = toolkit_wrapper.from_smiles(smiles)
-        molecule.generate_conformers(
-            rms_cutoff=1 * unit.angstrom,
-            n_conformers=100,
-            toolkit_registry=toolkit_wrapper,
-        )
-        assert molecule.n_conformers > 1
-        assert not (molecule.conformers[0] == (0.0 * unit.angstrom)).all()
-
-        # Ensure rms_cutoff kwarg is working
-        molecule2 = toolkit_wrapper.from_smiles(smiles)
-        molecule2.generate_conformers(
-            rms_cutoff=0.1 * unit.angstrom,
-            n_conformers=100,
-            toolkit_registry=toolkit_wrapper,
-        )
-        assert molecule2.n_conformers > molecule.n_conformers
-
-        # Ensure n_conformers kwarg is working
-        molecule2 = toolkit_wrapper.from_smiles(smiles)
-        molecule2.generate_conformers(
-            rms_cutoff=0.1 * unit.angstrom,
-            n_conformers=10,
-            toolkit_registry=toolkit_wrapper,
-        )
-        assert molecule2.n_conformers == 10
+        assert (molecule.conformers[0] / unit.angstrom).any()
 
-    def test_compute_partial_charges_am1bcc(self):
+    def test_compute_partial_charges_am1bcc(self, openeye_registry, ethanol):
         """Test OpenEyeToolkitWrapper compute_partial_charges_am1bcc()"""
-        toolkit_registry = ToolkitRegistry(toolkit_precedence=[OpenEyeToolkitWrapper])
-        molecule = create_ethanol()
+        molecule = ethanol
         molecule.compute_partial_charges_am1bcc(
-            toolkit_registry=toolkit_registry
+            toolkit_registry=openeye_registry
         )  # , charge_model=charge_model)
-        charge_sum = 0 * unit.elementary_charge
-        abs_charge_sum = 0 * unit.elementary_charge
-        for pc in molecule._partial_charges:
-            charge_sum += pc
-            abs_charge_sum += abs(pc)
-        assert abs(charge_sum) < 0.005 * unit.elementary_charge
-        assert abs_charge_sum > 0.25 * unit.elementary_charge
-
-    def test_compute_partial_charges_am1bcc_net_charge(self):
+        charges = molecule._partial_charges / unit.elementary_charge
+        assert abs(charges.sum()) < 0.005
+        assert np.abs(charges).sum() > 0.25
+
+    def test_compute_partial_charges_am1bcc_net_charge(self, openeye_registry, acetate):
         """Test OpenEyeToolkitWrapper assign_partial_charges() on a molecule with a net +1 charge"""
-        toolkit_registry = ToolkitRegistry(toolkit_precedence=[OpenEyeToolkitWrapper])
-        molecule = create_acetate()
-        molecule.compute_partial_charges_am1bcc(toolkit_registry=toolkit_registry)
-        charge_sum = 0 * unit.elementary_charge
-        for pc in molecule._partial_charges:
-            charge_sum += pc
-        assert (
-            -0.999 * unit.elementary_charge
-            > charge_sum
-            > -1.001 * unit.elementary_charge
-        )
+        molecule = acetate
+        molecule.compute_partial_charges_am1bcc(toolkit_registry=openeye_registry)
+        charge_sum = (molecule._partial_charges / unit.elementary_charge).sum()
+        assert -0.999 > charge_sum > -1.001
 
-    def test_compute_partial_charges_am1bcc_wrong_n_confs(self):
+    def test_compute_partial_charges_am1bcc_wrong_n_confs(
+        self, openeye_registry, ethanol
+    ):
         """
         Test OpenEyeToolkitWrapper compute_partial_charges_am1bcc() when requesting to use an incorrect number of
         conformers. This test is a bit shorter than that for AmberToolsToolkitWrapper because OETK uses the
         ELF10 multiconformer method of AM1BCC, which doesn't have a maximum number of conformers.
         """
-        from openforcefield.tests.test_forcefield import create_ethanol
-
-        toolkit_registry = ToolkitRegistry(toolkit_precedence=[OpenEyeToolkitWrapper])
-        molecule = create_ethanol()
+        molecule = ethanol
         molecule.generate_conformers(
             n_conformers=2,
             rms_cutoff=0.1 * unit.angstrom,
-            toolkit_registry=toolkit_registry,
+            toolkit_registry=openeye_registry,
         )
 
         # Try again, with strict_n_confs as true, but not including use_confs, so the
         # recommended number of confs will be generated
         molecule.compute_partial_charges_am1bcc(
-            toolkit_registry=toolkit_registry, strict_n_conformers=True
+            toolkit_registry=openeye_registry, strict_n_conformers=True
         )
 
     @pytest.mark.parametrize(
         "partial_charge_method", ["am1bcc", "am1elf10", "am1-mulliken", "gasteiger"]
     )
-    def test_assign_partial_charges_neutral(self, partial_charge_method):
+    def test_assign_partial_charges_neutral(
+        self, openeye_registry, ethanol, partial_charge_method
+    ):
         """Test OpenEyeToolkitWrapper assign_partial_charges()"""
-        from openforcefield.tests.test_forcefield import create_ethanol
-
-        toolkit_registry = ToolkitRegistry(toolkit_precedence=[OpenEyeToolkitWrapper])
-        molecule = create_ethanol()
+        molecule = ethanol
         molecule.assign_partial_charges(
-            toolkit_registry=toolkit_registry,
+            toolkit_registry=openeye_registry,
             partial_charge_method=partial_charge_method,
         )
-        charge_sum = 0.0 * unit.elementary_charge
-        for pc in molecule.partial_charges:
-            charge_sum += pc
-        assert -1.0e-5 < charge_sum.value_in_unit(unit.elementary_charge) < 1.0e-5
+        charge_sum = (molecule.partial_charges / unit.elementary_charge).sum()
+        assert -1.0e-5 < charge_sum < 1.0e-5
 
     @pytest.mark.parametrize("partial_charge_method", ["am1bcc", "am1-mulliken"])
-    def test_assign_partial_charges_conformer_dependence(self, partial_charge_method):
+    def test_assign_partial_charges_conformer_dependence(
+        self, openeye_registry, ethanol, partial_charge_method
+    ):
         """Test OpenEyeToolkitWrapper assign_partial_charges()'s use_conformers kwarg
         to ensure charges are really conformer dependent. Skip Gasteiger because it isn't
         conformer dependent."""
         import copy
 
-        from openforcefield.tests.test_forcefield import create_ethanol
-
-        toolkit_registry = ToolkitRegistry(toolkit_precedence=[OpenEyeToolkitWrapper])
-        molecule = create_ethanol()
+        molecule = ethanol
         molecule.generate_conformers(n_conformers=1)
         molecule.assign_partial_charges(
-            toolkit_registry=toolkit_registry,
+            toolkit_registry=openeye_registry,
             partial_charge_method=partial_charge_method,
             use_conformers=molecule.conformers,
         )
@@ -1058,39 +1173,38 @@ class TestOpenEyeToolkitWrapper:
         molecule._conformers[0][1][1] -= 0.2 * unit.angstrom
         molecule._conformers[0][2][1] += 0.2 * unit.angstrom
         molecule.assign_partial_charges(
-            toolkit_registry=toolkit_registry,
+            toolkit_registry=openeye_registry,
             partial_charge_method=partial_charge_method,
             use_conformers=molecule.conformers,
         )
-        for pc1, pc2 in zip(pcs1, molecule.partial_charges):
-            assert abs(pc1 - pc2) > 1.0e-5 * unit.elementary_charge
+        pcs2 = molecule.partial_charges
+        assert (
+            np.abs(pcs1 / unit.elementary_charge - pcs2 / unit.elementary_charge)
+            > 1.0e-5
+        ).all()
 
     @pytest.mark.parametrize(
         "partial_charge_method", ["am1bcc", "am1elf10", "am1-mulliken", "gasteiger"]
     )
-    def test_assign_partial_charges_net_charge(self, partial_charge_method):
+    def test_assign_partial_charges_net_charge(
+        self, openeye_registry, partial_charge_method, acetate
+    ):
         """
         Test OpenEyeToolkitWrapper assign_partial_charges() on a molecule with net charge.
         """
-        from openforcefield.tests.test_forcefield import create_acetate
-
-        toolkit_registry = ToolkitRegistry(toolkit_precedence=[OpenEyeToolkitWrapper])
-        molecule = create_acetate()
+        molecule = acetate
         molecule.assign_partial_charges(
-            toolkit_registry=toolkit_registry,
+            toolkit_registry=openeye_registry,
             partial_charge_method=partial_charge_method,
         )
-        charge_sum = 0.0 * unit.elementary_charge
-        for pc in molecule.partial_charges:
-            charge_sum += pc
-        assert -1.0e-5 < charge_sum.value_in_unit(unit.elementary_charge) + 1.0 < 1.0e-5
+        charge_sum = (molecule.partial_charges / unit.elementary_charge).sum()
+        assert -1.0e-5 < charge_sum + 1.0 < 1.0e-5
 
-    def test_assign_partial_charges_bad_charge_method(self):
+    def test_assign_partial_charges_bad_charge_method(
+        self, openeye_registry, openeye_wrapper, ethanol
+    ):
         """Test OpenEyeToolkitWrapper assign_partial_charges() for a nonexistent charge method"""
-        from openforcefield.tests.test_forcefield import create_ethanol
-
-        toolkit_registry = ToolkitRegistry(toolkit_precedence=[OpenEyeToolkitWrapper])
-        molecule = create_ethanol()
+        molecule = ethanol
 
         # Molecule.assign_partial_charges calls the ToolkitRegistry with raise_exception_types = [],
         # which means it will only ever return ValueError
@@ -1098,7 +1212,7 @@ class TestOpenEyeToolkitWrapper:
             ValueError, match="is not available from OpenEyeToolkitWrapper"
         ) as excinfo:
             molecule.assign_partial_charges(
-                toolkit_registry=toolkit_registry,
+                toolkit_registry=openeye_registry,
                 partial_charge_method="NotARealChargeMethod",
             )
 
@@ -1107,8 +1221,7 @@ class TestOpenEyeToolkitWrapper:
             ChargeMethodUnavailableError,
             match="is not available from OpenEyeToolkitWrapper",
         ) as excinfo:
-            OETKW = OpenEyeToolkitWrapper()
-            OETKW.assign_partial_charges(
+            openeye_wrapper.assign_partial_charges(
                 molecule=molecule, partial_charge_method="NotARealChargeMethod"
             )
 
@@ -1117,27 +1230,33 @@ class TestOpenEyeToolkitWrapper:
         [("am1bcc", 1), ("am1-mulliken", 1), ("gasteiger", 0)],
     )
     def test_assign_partial_charges_wrong_n_confs(
-        self, partial_charge_method, expected_n_confs
+        self,
+        openeye_registry,
+        openeye_wrapper,
+        ethanol,
+        partial_charge_method,
+        expected_n_confs,
     ):
         """
         Test OpenEyeToolkitWrapper assign_partial_charges() when requesting to use an incorrect number of
         conformers
         """
-        from openforcefield.tests.test_forcefield import create_ethanol
-
-        toolkit_registry = ToolkitRegistry(toolkit_precedence=[OpenEyeToolkitWrapper])
-        molecule = create_ethanol()
+        molecule = ethanol
         molecule.generate_conformers(n_conformers=2, rms_cutoff=0.01 * unit.angstrom)
 
+        expected_message = (
+            f"has 2 conformers, but charge method '{partial_charge_method}' "
+            f"expects exactly {expected_n_confs}."
+        )
+
         # Try passing in the incorrect number of confs, but without specifying strict_n_conformers,
         # which should produce a warning
         with pytest.warns(
             IncorrectNumConformersWarning,
-            match=f"has 2 conformers, but charge method '{partial_charge_method}' "
-            f"expects exactly {expected_n_confs}.",
+            match=expected_message,
         ):
             molecule.assign_partial_charges(
-                toolkit_registry=toolkit_registry,
+                toolkit_registry=openeye_registry,
                 partial_charge_method=partial_charge_method,
                 use_conformers=molecule.conformers,
                 strict_n_conformers=False,
@@ -1146,7 +1265,7 @@ class TestOpenEyeToolkitWrapper:
         # Try again, with strict_n_confs as true, but not including use_confs, so the
         # recommended number of confs will be generated
         molecule.assign_partial_charges(
-            toolkit_registry=toolkit_registry,
+            toolkit_registry=openeye_registry,
             partial_charge_method=partial_charge_method,
             strict_n_conformers=True,
         )
@@ -1156,11 +1275,10 @@ class TestOpenEyeToolkitWrapper:
         # in a failed task together in a single ValueError.
         with pytest.raises(
             ValueError,
-            match=f"has 2 conformers, but charge method '{partial_charge_method}' "
-            f"expects exactly {expected_n_confs}.",
+            match=expected_message,
         ):
             molecule.assign_partial_charges(
-                toolkit_registry=toolkit_registry,
+                toolkit_registry=openeye_registry,
                 partial_charge_method=partial_charge_method,
                 use_conformers=molecule.conformers,
                 strict_n_conformers=True,
@@ -1170,260 +1288,141 @@ class TestOpenEyeToolkitWrapper:
         # confs, and specify strict_n_conformers, which should produce an IncorrectNumConformersError
         with pytest.raises(
             IncorrectNumConformersError,
-            match=f"has 2 conformers, but charge method '{partial_charge_method}' "
-            f"expects exactly {expected_n_confs}.",
+            match=expected_message,
         ):
-            OETKW = OpenEyeToolkitWrapper()
-            OETKW.assign_partial_charges(
+            openeye_wrapper.assign_partial_charges(
                 molecule=molecule,
                 partial_charge_method=partial_charge_method,
                 use_conformers=molecule.conformers,
                 strict_n_conformers=True,
             )
 
-    def test_compute_partial_charges_failure(self):
+    def test_compute_partial_charges_failure(self, openeye_wrapper):
         """Test OpenEyeToolkitWrapper compute_partial_charges() on a molecule it cannot assign charges to"""
 
-        toolkit_wrapper = OpenEyeToolkitWrapper()
         smiles = "[Li+1]"
-        molecule = toolkit_wrapper.from_smiles(smiles)
-        molecule.generate_conformers(toolkit_registry=toolkit_wrapper)
+        molecule = openeye_wrapper.from_smiles(smiles)
+        molecule.generate_conformers(toolkit_registry=openeye_wrapper)
 
         # For now, I'm just testing AM1-BCC (will test more when the SMIRNOFF spec for other charges is finalized)
         with pytest.raises(Exception) as excinfo:
-            molecule.compute_partial_charges_am1bcc(toolkit_registry=toolkit_wrapper)
+            molecule.compute_partial_charges_am1bcc(toolkit_registry=openeye_wrapper)
             assert "Unable to assign charges" in str(excinfo)
             assert "OE Error: " in str(excinfo)
 
-    def test_compute_partial_charges_trans_cooh_am1bcc(self):
+    def test_compute_partial_charges_trans_cooh_am1bcc(self, openeye_wrapper):
         """Test OpenEyeToolkitWrapper for computing partial charges for problematic molecules, as exemplified by
         Issue 346 (https://github.com/openforcefield/openforcefield/issues/346)"""
 
         lysine = Molecule.from_smiles("C(CC[NH3+])C[C@@H](C(=O)O)N")
-        toolkit_wrapper = OpenEyeToolkitWrapper()
-        lysine.generate_conformers(toolkit_registry=toolkit_wrapper)
-        lysine.compute_partial_charges_am1bcc(toolkit_registry=toolkit_wrapper)
+        lysine.generate_conformers(toolkit_registry=openeye_wrapper)
+        lysine.compute_partial_charges_am1bcc(toolkit_registry=openeye_wrapper)
 
-    def test_assign_fractional_bond_orders(self):
+    def test_assign_fractional_bond_orders(self, openeye_wrapper):
         """Test OpenEyeToolkitWrapper assign_fractional_bond_orders()"""
 
-        toolkit_wrapper = OpenEyeToolkitWrapper()
         smiles = "[H]C([H])([H])C([H])([H])[H]"
-        molecule = toolkit_wrapper.from_smiles(smiles)
-        molecule.generate_conformers(toolkit_registry=toolkit_wrapper)
+        molecule = openeye_wrapper.from_smiles(smiles)
+        molecule.generate_conformers(toolkit_registry=openeye_wrapper)
         for bond_order_model in ["am1-wiberg", "pm3-wiberg"]:
             molecule.assign_fractional_bond_orders(
-                toolkit_registry=toolkit_wrapper, bond_order_model=bond_order_model
+                toolkit_registry=openeye_wrapper, bond_order_model=bond_order_model
             )
             # TODO: Add test for equivalent Wiberg orders for equivalent bonds
 
-    def test_assign_fractional_bond_orders_neutral_charge_mol(self):
+    def test_assign_fractional_bond_orders_neutral_charge_mol(
+        self, openeye_wrapper, cid20742535_neutral, cid20742535_anion
+    ):
         """Test OpenEyeToolkitWrapper assign_fractional_bond_orders() for neutral and charged molecule"""
 
-        toolkit_wrapper = OpenEyeToolkitWrapper()
-        # Reading neutral molecule from file
-        filename = get_data_file_path("molecules/CID20742535_neutral.sdf")
-        molecule1 = Molecule.from_file(filename)
-        # Reading negative molecule from file
-        filename = get_data_file_path("molecules/CID20742535_anion.sdf")
-        molecule2 = Molecule.from_file(filename)
+        molecule1 = cid20742535_neutral
+        molecule2 = cid20742535_anion
 
         # Checking that only one additional bond is present in the neutral molecule
         assert len(molecule1.bonds) == len(molecule2.bonds) + 1
 
         for bond_order_model in ["am1-wiberg"]:
             molecule1.assign_fractional_bond_orders(
-                toolkit_registry=toolkit_wrapper,
+                toolkit_registry=openeye_wrapper,
                 bond_order_model=bond_order_model,
                 use_conformers=molecule1.conformers,
             )
 
-            for i in molecule1.bonds:
-                if i.is_aromatic:
-                    # Checking aromatic bonds
-                    assert 1.05 < i.fractional_bond_order < 1.65
-                elif i.atom1.atomic_number == 1 or i.atom2.atomic_number == 1:
-                    # Checking bond order of C-H or O-H bonds are around 1
-                    assert 0.85 < i.fractional_bond_order < 1.05
-                elif i.atom1.atomic_number == 8 or i.atom2.atomic_number == 8:
-                    # Checking C-O single bond
-                    wbo_C_O_neutral = i.fractional_bond_order
-                    assert 1.0 < wbo_C_O_neutral < 1.5
-                else:
-                    # Should be C-C single bond
-                    assert (i.atom1_index == 4 and i.atom2_index == 6) or (
-                        i.atom1_index == 6 and i.atom2_index == 4
-                    )
-                    wbo_C_C_neutral = i.fractional_bond_order
-                    assert 1.0 < wbo_C_C_neutral < 1.3
+            wbo_C_O_neutral, wbo_C_C_neutral = _validate_wbos(molecule1, 1.0, 1.5)
 
             molecule2.assign_fractional_bond_orders(
-                toolkit_registry=toolkit_wrapper,
+                toolkit_registry=openeye_wrapper,
                 bond_order_model=bond_order_model,
                 use_conformers=molecule2.conformers,
             )
-            for i in molecule2.bonds:
-                if i.is_aromatic:
-                    # Checking aromatic bonds
-                    assert 1.05 < i.fractional_bond_order < 1.65
-                elif i.atom1.atomic_number == 1 or i.atom2.atomic_number == 1:
-                    # Checking bond order of C-H or O-H bonds are around 1
-                    assert 0.85 < i.fractional_bond_order < 1.05
-                elif i.atom1.atomic_number == 8 or i.atom2.atomic_number == 8:
-                    # Checking C-O single bond
-                    wbo_C_O_anion = i.fractional_bond_order
-                    assert 1.3 < wbo_C_O_anion < 1.8
-                else:
-                    # Should be C-C single bond
-                    assert (i.atom1_index == 4 and i.atom2_index == 6) or (
-                        i.atom1_index == 6 and i.atom2_index == 4
-                    )
-                    wbo_C_C_anion = i.fractional_bond_order
-                    assert 1.0 < wbo_C_C_anion < 1.3
+            wbo_C_O_anion, wbo_C_C_anion = _validate_wbos(molecule2, 1.3, 1.8)
 
             # Wiberg bond order of C-C single bond is higher in the anion
             assert wbo_C_C_anion > wbo_C_C_neutral
             # Wiberg bond order of C-O bond is higher in the anion
             assert wbo_C_O_anion > wbo_C_O_neutral
 
-    def test_assign_fractional_bond_orders_charged(self):
+    def test_assign_fractional_bond_orders_charged(self, openeye_wrapper):
         """Test OpenEyeToolkitWrapper assign_fractional_bond_orders() on a molecule with net charge +1"""
 
-        toolkit_wrapper = OpenEyeToolkitWrapper()
         smiles = "[H]C([H])([H])[N+]([H])([H])[H]"
-        molecule = toolkit_wrapper.from_smiles(smiles)
-        molecule.generate_conformers(toolkit_registry=toolkit_wrapper)
+        molecule = openeye_wrapper.from_smiles(smiles)
+        molecule.generate_conformers(toolkit_registry=openeye_wrapper)
         for bond_order_model in ["am1-wiberg", "pm3-wiberg"]:
             molecule.assign_fractional_bond_orders(
-                toolkit_registry=toolkit_wrapper, bond_order_model=bond_order_model
+                toolkit_registry=openeye_wrapper, bond_order_model=bond_order_model
             )
             # TODO: Add test for equivalent Wiberg orders for equivalent bonds
 
-    def test_assign_fractional_bond_orders_invalid_method(self):
+    def test_assign_fractional_bond_orders_invalid_method(self, openeye_wrapper):
         """
         Test that OpenEyeToolkitWrapper assign_fractional_bond_orders() raises the
         correct error if an invalid charge model is provided
         """
-        toolkit_wrapper = OpenEyeToolkitWrapper()
         smiles = "[H]C([H])([H])[N+]([H])([H])[H]"
-        molecule = toolkit_wrapper.from_smiles(smiles)
-        molecule.generate_conformers(toolkit_registry=toolkit_wrapper)
+        molecule = openeye_wrapper.from_smiles(smiles)
+        molecule.generate_conformers(toolkit_registry=openeye_wrapper)
         expected_error = (
             "Bond order model 'not a real bond order model' is not supported by "
             "OpenEyeToolkitWrapper. Supported models are ([[]'am1-wiberg', 'pm3-wiberg'[]])"
         )
         with pytest.raises(ValueError, match=expected_error) as excinfo:
             molecule.assign_fractional_bond_orders(
-                toolkit_registry=toolkit_wrapper,
+                toolkit_registry=openeye_wrapper,
                 bond_order_model="not a real bond order model",
             )
 
-    def test_assign_fractional_bond_orders_double_bond(self):
+    def test_assign_fractional_bond_orders_double_bond(self, openeye_wrapper):
         """Test OpenEyeToolkitWrapper assign_fractional_bond_orders() on a molecule with a double bond"""
 
-        toolkit_wrapper = OpenEyeToolkitWrapper()
         smiles = r"C\C(F)=C(/F)C[C@@](C)(Cl)Br"
-        molecule = toolkit_wrapper.from_smiles(smiles)
-        molecule.generate_conformers(toolkit_registry=toolkit_wrapper)
+        molecule = openeye_wrapper.from_smiles(smiles)
+        molecule.generate_conformers(toolkit_registry=openeye_wrapper)
         for bond_order_model in ["am1-wiberg", "pm3-wiberg"]:
             molecule.assign_fractional_bond_orders(
-                toolkit_registry=toolkit_wrapper, bond_order_model=bond_order_model
+                toolkit_registry=openeye_wrapper, bond_order_model=bond_order_model
             )
             # TODO: Add test for equivalent Wiberg orders for equivalent bonds
 
-        double_bond_has_wbo_near_2 = False
-        for bond in molecule.bonds:
-            if bond.bond_order == 2:
-                if 1.75 < bond.fractional_bond_order < 2.25:
-                    double_bond_has_wbo_near_2 = True
-        assert double_bond_has_wbo_near_2
+        assert any(
+            bond.bond_order == 2 and 1.75 < bond.fractional_bond_order < 2.25
+            for bond in molecule.bonds
+        )
 
     @pytest.mark.slow
     @requires_openeye
-    def test_substructure_search_on_large_molecule(self):
+    def test_substructure_search_on_large_molecule(self, openeye_wrapper):
         """Test OpenEyeToolkitWrapper substructure search when a large number hits are found"""
 
-        tk = OpenEyeToolkitWrapper()
         smiles = "C" * 600
-        molecule = tk.from_smiles(smiles)
+        molecule = openeye_wrapper.from_smiles(smiles)
         query = "[C:1]~[C:2]"
-        ret = molecule.chemical_environment_matches(query, toolkit_registry=tk)
+        ret = molecule.chemical_environment_matches(
+            query, toolkit_registry=openeye_wrapper
+        )
         assert len(ret) == 1198
         assert len(ret[0]) == 2
 
-    def test_find_rotatable_bonds(self):
-        """Test finding rotatable bonds while ignoring some groups"""
-
-        # test a simple molecule
-        ethanol = create_ethanol()
-        bonds = ethanol.find_rotatable_bonds()
-        assert len(bonds) == 2
-        for bond in bonds:
-            assert ethanol.atoms[bond.atom1_index].atomic_number != 1
-            assert ethanol.atoms[bond.atom2_index].atomic_number != 1
-
-        # now ignore the C-O bond, forwards
-        bonds = ethanol.find_rotatable_bonds(ignore_functional_groups="[#6:1]-[#8:2]")
-        assert len(bonds) == 1
-        assert ethanol.atoms[bonds[0].atom1_index].atomic_number == 6
-        assert ethanol.atoms[bonds[0].atom2_index].atomic_number == 6
-
-        # now ignore the O-C bond, backwards
-        bonds = ethanol.find_rotatable_bonds(ignore_functional_groups="[#8:1]-[#6:2]")
-        assert len(bonds) == 1
-        assert ethanol.atoms[bonds[0].atom1_index].atomic_number == 6
-        assert ethanol.atoms[bonds[0].atom2_index].atomic_number == 6
-
-        # now ignore the C-C bond
-        bonds = ethanol.find_rotatable_bonds(ignore_functional_groups="[#6:1]-[#6:2]")
-        assert len(bonds) == 1
-        assert ethanol.atoms[bonds[0].atom1_index].atomic_number == 6
-        assert ethanol.atoms[bonds[0].atom2_index].atomic_number == 8
-
-        # ignore a list of searches, forward
-        bonds = ethanol.find_rotatable_bonds(
-            ignore_functional_groups=["[#6:1]-[#8:2]", "[#6:1]-[#6:2]"]
-        )
-        assert bonds == []
-
-        # ignore a list of searches, backwards
-        bonds = ethanol.find_rotatable_bonds(
-            ignore_functional_groups=["[#6:1]-[#6:2]", "[#8:1]-[#6:2]"]
-        )
-        assert bonds == []
-
-        # test  molecules that should have no rotatable bonds
-        cyclohexane = create_cyclohexane()
-        bonds = cyclohexane.find_rotatable_bonds()
-        assert bonds == []
-
-        methane = Molecule.from_smiles("C")
-        bonds = methane.find_rotatable_bonds()
-        assert bonds == []
-
-        ethene = Molecule.from_smiles("C=C")
-        bonds = ethene.find_rotatable_bonds()
-        assert bonds == []
-
-        terminal_forwards = "[*]~[*:1]-[X2H1,X3H2,X4H3:2]-[#1]"
-        terminal_backwards = "[#1]-[X2H1,X3H2,X4H3:1]-[*:2]~[*]"
-        # test removing terminal rotors
-        toluene = Molecule.from_file(get_data_file_path("molecules/toluene.sdf"))
-        bonds = toluene.find_rotatable_bonds()
-        assert len(bonds) == 1
-        assert toluene.atoms[bonds[0].atom1_index].atomic_number == 6
-        assert toluene.atoms[bonds[0].atom2_index].atomic_number == 6
-
-        # find terminal bonds forward
-        bonds = toluene.find_rotatable_bonds(ignore_functional_groups=terminal_forwards)
-        assert bonds == []
-
-        # find terminal bonds backwards
-        bonds = toluene.find_rotatable_bonds(
-            ignore_functional_groups=terminal_backwards
-        )
-        assert bonds == []
-
         # TODO: Check partial charge invariants (total charge, charge equivalence)
 
         # TODO: Add test for aromaticity
@@ -1434,15 +1433,14 @@ class TestOpenEyeToolkitWrapper:
 class TestRDKitToolkitWrapper:
     """Test the RDKitToolkitWrapper"""
 
-    def test_smiles(self):
+    def test_smiles(self, rdkit_wrapper):
         """Test RDKitToolkitWrapper to_smiles() and from_smiles()"""
-        toolkit_wrapper = RDKitToolkitWrapper()
         # This differs from OE's expected output due to different canonicalization schemes
         smiles = "[H][C]([H])([H])[C]([H])([H])[H]"
-        molecule = Molecule.from_smiles(smiles, toolkit_registry=toolkit_wrapper)
+        molecule = Molecule.from_smiles(smiles, toolkit_registry=rdkit_wrapper)
         # When making a molecule from SMILES, partial charges should be initialized to None
         assert molecule.partial_charges is None
-        smiles2 = molecule.to_smiles(toolkit_registry=toolkit_wrapper)
+        smiles2 = molecule.to_smiles(toolkit_registry=rdkit_wrapper)
         # print(smiles, smiles2)
         assert smiles == smiles2
 
@@ -1454,37 +1452,36 @@ class TestRDKitToolkitWrapper:
             (r"CC(F)=C(F)C[C@@](C)(Cl)Br", "Bonds with undefined stereochemistry"),
         ],
     )
-    def test_smiles_missing_stereochemistry(self, smiles, exception_regex):
+    def test_smiles_missing_stereochemistry(
+        self, rdkit_wrapper, smiles, exception_regex
+    ):
         """Test RDKitToolkitWrapper to_smiles() and from_smiles() when given ambiguous stereochemistry"""
-        toolkit_wrapper = RDKitToolkitWrapper()
 
         if exception_regex is not None:
             with pytest.raises(UndefinedStereochemistryError, match=exception_regex):
-                Molecule.from_smiles(smiles, toolkit_registry=toolkit_wrapper)
+                Molecule.from_smiles(smiles, toolkit_registry=rdkit_wrapper)
             Molecule.from_smiles(
-                smiles, toolkit_registry=toolkit_wrapper, allow_undefined_stereo=True
+                smiles, toolkit_registry=rdkit_wrapper, allow_undefined_stereo=True
             )
         else:
-            Molecule.from_smiles(smiles, toolkit_registry=toolkit_wrapper)
+            Molecule.from_smiles(smiles, toolkit_registry=rdkit_wrapper)
 
     # TODO: test_smiles_round_trip
 
-    def test_smiles_add_H(self):
+    def test_smiles_add_H(self, rdkit_wrapper):
         """Test RDKitToolkitWrapper to_smiles() and from_smiles()"""
-        toolkit_wrapper = RDKitToolkitWrapper()
         input_smiles = "CC"
         # This differs from OE's expected output due to different canonicalization schemes
         expected_output_smiles = "[H][C]([H])([H])[C]([H])([H])[H]"
-        molecule = Molecule.from_smiles(input_smiles, toolkit_registry=toolkit_wrapper)
-        smiles2 = molecule.to_smiles(toolkit_registry=toolkit_wrapper)
+        molecule = Molecule.from_smiles(input_smiles, toolkit_registry=rdkit_wrapper)
+        smiles2 = molecule.to_smiles(toolkit_registry=rdkit_wrapper)
         assert smiles2 == expected_output_smiles
 
-    def test_rdkit_from_smiles_hydrogens_are_explicit(self):
+    def test_rdkit_from_smiles_hydrogens_are_explicit(self, rdkit_wrapper):
         """
         Test to ensure that RDKitToolkitWrapper.from_smiles has the proper behavior with
         respect to its hydrogens_are_explicit kwarg
         """
-        toolkit_wrapper = RDKitToolkitWrapper()
         smiles_impl = "C#C"
         with pytest.raises(
             ValueError,
@@ -1492,17 +1489,17 @@ class TestRDKitToolkitWrapper:
         ) as excinfo:
             offmol = Molecule.from_smiles(
                 smiles_impl,
-                toolkit_registry=toolkit_wrapper,
+                toolkit_registry=rdkit_wrapper,
                 hydrogens_are_explicit=True,
             )
         offmol = Molecule.from_smiles(
-            smiles_impl, toolkit_registry=toolkit_wrapper, hydrogens_are_explicit=False
+            smiles_impl, toolkit_registry=rdkit_wrapper, hydrogens_are_explicit=False
         )
         assert offmol.n_atoms == 4
 
         smiles_expl = "[H][C]#[C][H]"
         offmol = Molecule.from_smiles(
-            smiles_expl, toolkit_registry=toolkit_wrapper, hydrogens_are_explicit=True
+            smiles_expl, toolkit_registry=rdkit_wrapper, hydrogens_are_explicit=True
         )
         assert offmol.n_atoms == 4
         # It's debatable whether this next function should pass. Strictly speaking, the hydrogens in this SMILES
@@ -1510,36 +1507,28 @@ class TestRDKitToolkitWrapper:
         # We might rethink the name of this kwarg.
 
         offmol = Molecule.from_smiles(
-            smiles_expl, toolkit_registry=toolkit_wrapper, hydrogens_are_explicit=False
+            smiles_expl, toolkit_registry=rdkit_wrapper, hydrogens_are_explicit=False
         )
         assert offmol.n_atoms == 4
 
     @pytest.mark.parametrize("molecule", get_mini_drug_bank(RDKitToolkitWrapper))
-    def test_to_inchi(self, molecule):
+    def test_to_inchi(self, rdkit_wrapper, molecule):
         """Test conversion to standard and non-standard InChI"""
 
-        toolkit = RDKitToolkitWrapper()
-        inchi = molecule.to_inchi(toolkit_registry=toolkit)
-        non_standard = molecule.to_inchi(fixed_hydrogens=True, toolkit_registry=toolkit)
+        inchi = molecule.to_inchi(toolkit_registry=rdkit_wrapper)
+        non_standard = molecule.to_inchi(
+            fixed_hydrogens=True, toolkit_registry=rdkit_wrapper
+        )
 
     @pytest.mark.parametrize("molecule", get_mini_drug_bank(RDKitToolkitWrapper))
-    def test_to_inchikey(self, molecule):
+    def test_to_inchikey(self, rdkit_wrapper, molecule):
         """Test the conversion to standard and non-standard InChIKey"""
 
-        toolkit = RDKitToolkitWrapper()
-        inchikey = molecule.to_inchikey(toolkit_registry=toolkit)
+        inchikey = molecule.to_inchikey(toolkit_registry=rdkit_wrapper)
         non_standard_key = molecule.to_inchikey(
-            fixed_hydrogens=True, toolkit_registry=toolkit
+            fixed_hydrogens=True, toolkit_registry=rdkit_wrapper
         )
 
-    def test_from_bad_inchi(self):
-        """Test building a molecule from a bad InChI string"""
-
-        toolkit = RDKitToolkitWrapper()
-        inchi = "InChI=1S/ksbfksfksfksbfks"
-        with pytest.raises(RuntimeError):
-            mol = Molecule.from_inchi(inchi, toolkit_registry=toolkit)
-
     inchi_data = [
         {
             "molecule": create_ethanol(),
@@ -1564,17 +1553,17 @@ class TestRDKitToolkitWrapper:
     ]
 
     @pytest.mark.parametrize("data", inchi_data)
-    def test_from_inchi(self, data):
+    def test_from_inchi(self, rdkit_wrapper, data):
         """Test building a molecule from standard and non-standard InChI strings."""
 
-        toolkit = RDKitToolkitWrapper()
-
         ref_mol = data["molecule"]
         # make a molecule from inchi
         inchi_mol = Molecule.from_inchi(
-            data["standard_inchi"], toolkit_registry=toolkit
+            data["standard_inchi"], toolkit_registry=rdkit_wrapper
+        )
+        assert (
+            inchi_mol.to_inchi(toolkit_registry=rdkit_wrapper) == data["standard_inchi"]
         )
-        assert inchi_mol.to_inchi(toolkit_registry=toolkit) == data["standard_inchi"]
 
         def compare_mols(ref_mol, inchi_mol):
             assert ref_mol.n_atoms == inchi_mol.n_atoms
@@ -1589,7 +1578,7 @@ class TestRDKitToolkitWrapper:
         nonstandard_inchi_mol = Molecule.from_inchi(data["fixed_hydrogen_inchi"])
         assert (
             nonstandard_inchi_mol.to_inchi(
-                fixed_hydrogens=True, toolkit_registry=toolkit
+                fixed_hydrogens=True, toolkit_registry=rdkit_wrapper
             )
             == data["fixed_hydrogen_inchi"]
         )
@@ -1597,24 +1586,23 @@ class TestRDKitToolkitWrapper:
         compare_mols(ref_mol, nonstandard_inchi_mol)
 
     @pytest.mark.parametrize("molecule", get_mini_drug_bank(RDKitToolkitWrapper))
-    def test_non_standard_inchi_round_trip(self, molecule):
+    def test_non_standard_inchi_round_trip(self, rdkit_wrapper, molecule):
         """Test if a molecule can survive an InChi round trip test in some cases the standard InChI
         will not be enough to ensure information is preserved so we test the non-standard inchi here."""
 
         from openforcefield.utils.toolkits import UndefinedStereochemistryError
 
-        toolkit = RDKitToolkitWrapper()
-        inchi = molecule.to_inchi(fixed_hydrogens=True, toolkit_registry=toolkit)
+        inchi = molecule.to_inchi(fixed_hydrogens=True, toolkit_registry=rdkit_wrapper)
         # make a copy of the molecule from the inchi string
         if molecule.name in rdkit_inchi_stereochemistry_lost:
             # some molecules lose stereochemsitry so they are skipped
             # if we fail here the molecule may of been fixed
             with pytest.raises(UndefinedStereochemistryError):
-                mol2 = molecule.from_inchi(inchi, toolkit_registry=toolkit)
+                mol2 = molecule.from_inchi(inchi, toolkit_registry=rdkit_wrapper)
 
         else:
             print(molecule.name)
-            mol2 = molecule.from_inchi(inchi, toolkit_registry=toolkit)
+            mol2 = molecule.from_inchi(inchi, toolkit_registry=rdkit_wrapper)
 
             # Some molecules are mangled by being round-tripped to/from InChI
             if molecule.name in rdkit_inchi_roundtrip_mangled:
@@ -1629,33 +1617,30 @@ class TestRDKitToolkitWrapper:
                 # we test quite strict isomorphism here
                 with pytest.raises(AssertionError):
                     assert molecule.is_isomorphic_with(
-                        mol2, bond_order_matching=False, toolkit_registry=toolkit
+                        mol2, bond_order_matching=False, toolkit_registry=rdkit_wrapper
                     )
             else:
                 assert molecule.is_isomorphic_with(
-                    mol2, bond_order_matching=False, toolkit_registry=toolkit
+                    mol2, bond_order_matching=False, toolkit_registry=rdkit_wrapper
                 )
 
-    def test_smiles_charged(self):
+    def test_smiles_charged(self, rdkit_wrapper):
         """Test RDKitWrapper functions for reading/writing charged SMILES"""
-        toolkit_wrapper = RDKitToolkitWrapper()
         # This differs from OE's expected output due to different canonicalization schemes
         smiles = "[H][C]([H])([H])[N+]([H])([H])[H]"
-        molecule = Molecule.from_smiles(smiles, toolkit_registry=toolkit_wrapper)
-        smiles2 = molecule.to_smiles(toolkit_registry=toolkit_wrapper)
+        molecule = Molecule.from_smiles(smiles, toolkit_registry=rdkit_wrapper)
+        smiles2 = molecule.to_smiles(toolkit_registry=rdkit_wrapper)
         assert smiles == smiles2
 
-    def test_to_from_rdkit_core_props_filled(self):
+    def test_to_from_rdkit_core_props_filled(self, rdkit_wrapper):
         """Test RDKitToolkitWrapper to_rdkit() and from_rdkit() when given populated core property fields"""
-        toolkit_wrapper = RDKitToolkitWrapper()
 
         # Replacing with a simple molecule with stereochemistry
         input_smiles = r"C\C(F)=C(/F)C[C@@](C)(Cl)Br"
         expected_output_smiles = r"[H][C]([H])([H])/[C]([F])=[C](\[F])[C]([H])([H])[C@@]([Cl])([Br])[C]([H])([H])[H]"
-        molecule = Molecule.from_smiles(input_smiles, toolkit_registry=toolkit_wrapper)
+        molecule = Molecule.from_smiles(input_smiles, toolkit_registry=rdkit_wrapper)
         assert (
-            molecule.to_smiles(toolkit_registry=toolkit_wrapper)
-            == expected_output_smiles
+            molecule.to_smiles(toolkit_registry=rdkit_wrapper) == expected_output_smiles
         )
 
         # Populate core molecule property fields
@@ -1686,40 +1671,15 @@ class TestRDKitToolkitWrapper:
             unit.elementary_charge,
         )
         molecule.partial_charges = partial_charges
-        coords = unit.Quantity(
-            np.array(
-                [
-                    ["0.0", "1.0", "2.0"],
-                    ["3.0", "4.0", "5.0"],
-                    ["6.0", "7.0", "8.0"],
-                    ["9.0", "10.0", "11.0"],
-                    ["12.0", "13.0", "14.0"],
-                    ["15.0", "16.0", "17.0"],
-                    ["18.0", "19.0", "20.0"],
-                    ["21.0", "22.0", "23.0"],
-                    ["24.0", "25.0", "26.0"],
-                    ["27.0", "28.0", "29.0"],
-                    ["30.0", "31.0", "32.0"],
-                    ["33.0", "34.0", "35.0"],
-                    ["36.0", "37.0", "38.0"],
-                    ["39.0", "40.0", "41.0"],
-                    ["42.0", "43.0", "44.0"],
-                    ["45.0", "46.0", "47.0"],
-                    ["48.0", "49.0", "50.0"],
-                    ["51.0", "52.0", "53.0"],
-                ]
-            ),
-            unit.angstrom,
-        )
+        coords = unit.Quantity(np.arange(54, dtype=float).reshape(18, 3), unit.angstrom)
         molecule.add_conformer(coords)
         # Populate core atom property fields
         molecule.atoms[2].name = "Bob"
         # Ensure one atom has its stereochemistry specified
-        central_carbon_stereo_specified = False
-        for atom in molecule.atoms:
-            if (atom.atomic_number == 6) and atom.stereochemistry == "S":
-                central_carbon_stereo_specified = True
-        assert central_carbon_stereo_specified
+        assert any(
+            (atom.atomic_number == 6) and atom.stereochemistry == "S"
+            for atom in molecule.atoms
+        )
 
         # Populate bond core property fields
         fractional_bond_orders = [float(val) for val in range(18)]
@@ -1735,45 +1695,45 @@ class TestRDKitToolkitWrapper:
         assert molecule.name == molecule2.name
         # NOTE: This expects the same indexing scheme in the original and new molecule
 
-        central_carbon_stereo_specified = False
-        for atom in molecule2.atoms:
-            if (atom.atomic_number == 6) and atom.stereochemistry == "S":
-                central_carbon_stereo_specified = True
-        assert central_carbon_stereo_specified
+        assert any(
+            (atom.atomic_number == 6) and atom.stereochemistry == "S"
+            for atom in molecule2.atoms
+        )
         for atom1, atom2 in zip(molecule.atoms, molecule2.atoms):
             assert atom1.to_dict() == atom2.to_dict()
         for bond1, bond2 in zip(molecule.bonds, molecule2.bonds):
             assert bond1.to_dict() == bond2.to_dict()
-        assert (molecule.conformers[0] == molecule2.conformers[0]).all()
-        for pc1, pc2 in zip(molecule._partial_charges, molecule2._partial_charges):
-            pc1_ul = pc1 / unit.elementary_charge
-            pc2_ul = pc2 / unit.elementary_charge
-            assert_almost_equal(pc1_ul, pc2_ul, decimal=6)
+        assert np.array_equal(
+            molecule.conformers[0] / unit.angstrom,
+            molecule2.conformers[0] / unit.angstrom,
+        )
+        np.testing.assert_allclose(
+            molecule._partial_charges / unit.elementary_charge,
+            molecule2._partial_charges / unit.elementary_charge,
+            atol=1.0e-6,
+        )
         assert (
-            molecule2.to_smiles(toolkit_registry=toolkit_wrapper)
+            molecule2.to_smiles(toolkit_registry=rdkit_wrapper)
             == expected_output_smiles
         )
         # TODO: This should be its own test
 
-    def test_to_from_rdkit_core_props_unset(self):
+    def test_to_from_rdkit_core_props_unset(self, rdkit_wrapper):
         """Test RDKitToolkitWrapper to_rdkit() and from_rdkit() when given empty core property fields"""
-        toolkit_wrapper = RDKitToolkitWrapper()
 
         # Replacing with a simple molecule with stereochemistry
         input_smiles = r"C\C(F)=C(/F)C[C@](C)(Cl)Br"
         expected_output_smiles = r"[H][C]([H])([H])/[C]([F])=[C](\[F])[C]([H])([H])[C@]([Cl])([Br])[C]([H])([H])[H]"
-        molecule = Molecule.from_smiles(input_smiles, toolkit_registry=toolkit_wrapper)
+        molecule = Molecule.from_smiles(input_smiles, toolkit_registry=rdkit_wrapper)
         assert (
-            molecule.to_smiles(toolkit_registry=toolkit_wrapper)
-            == expected_output_smiles
+            molecule.to_smiles(toolkit_registry=rdkit_wrapper) == expected_output_smiles
         )
 
         # Ensure one atom has its stereochemistry specified
-        central_carbon_stereo_specified = False
-        for atom in molecule.atoms:
-            if (atom.atomic_number == 6) and atom.stereochemistry == "R":
-                central_carbon_stereo_specified = True
-        assert central_carbon_stereo_specified
+        assert any(
+            (atom.atomic_number == 6) and atom.stereochemistry == "R"
+            for atom in molecule.atoms
+        )
 
         # Do a first conversion to/from rdmol
         rdmol = molecule.to_rdkit()
@@ -1783,11 +1743,10 @@ class TestRDKitToolkitWrapper:
         assert molecule.name == molecule2.name
         # NOTE: This expects the same indexing scheme in the original and new molecule
 
-        central_carbon_stereo_specified = False
-        for atom in molecule2.atoms:
-            if (atom.atomic_number == 6) and atom.stereochemistry == "R":
-                central_carbon_stereo_specified = True
-        assert central_carbon_stereo_specified
+        assert any(
+            (atom.atomic_number == 6) and atom.stereochemistry == "R"
+            for atom in molecule2.atoms
+        )
         for atom1, atom2 in zip(molecule.atoms, molecule2.atoms):
             assert atom1.to_dict() == atom2.to_dict()
         for bond1, bond2 in zip(molecule.bonds, molecule2.bonds):
@@ -1800,144 +1759,98 @@ class TestRDKitToolkitWrapper:
         assert molecule2.partial_charges is None
 
         assert (
-            molecule2.to_smiles(toolkit_registry=toolkit_wrapper)
+            molecule2.to_smiles(toolkit_registry=rdkit_wrapper)
             == expected_output_smiles
         )
 
-    def test_file_extension_case(self):
-        """
-        Test round-trips of some file extensions when called directly from the toolkit wrappers,
-        including lower- and uppercase file extensions. Note that this test does not ensure
-        accuracy, it only tests that reading/writing without raising an exception.
-        """
-        mols_in = RDKitToolkitWrapper().from_file(
-            file_path=get_data_file_path("molecules/ethanol.sdf"), file_format="sdf"
-        )
-
-        assert len(mols_in) > 0
-
-        mols_in = RDKitToolkitWrapper().from_file(
-            file_path=get_data_file_path("molecules/ethanol.sdf"), file_format="SDF"
-        )
-
-        assert len(mols_in) > 0
-
-    def test_get_sdf_coordinates(self):
+    def test_get_sdf_coordinates(self, rdkit_wrapper):
         """Test RDKitToolkitWrapper for importing a single set of coordinates from a sdf file"""
-        toolkit_wrapper = RDKitToolkitWrapper()
-        filename = get_data_file_path("molecules/toluene.sdf")
-        molecule = Molecule.from_file(filename, toolkit_registry=toolkit_wrapper)
+        filename = TOLUENE_SDF
+        molecule = Molecule.from_file(filename, toolkit_registry=rdkit_wrapper)
         assert len(molecule.conformers) == 1
         assert molecule.conformers[0].shape == (15, 3)
         assert_almost_equal(
             molecule.conformers[0][5][1] / unit.angstrom, 2.0104, decimal=4
         )
 
-    def test_read_sdf_charges(self):
+    def test_read_sdf_charges(self, rdkit_wrapper):
         """Test RDKitToolkitWrapper for importing a charges from a sdf file"""
-        toolkit_wrapper = RDKitToolkitWrapper()
-        filename = get_data_file_path("molecules/ethanol_partial_charges.sdf")
-        molecule = Molecule.from_file(filename, toolkit_registry=toolkit_wrapper)
+        filename = ETHANOL_PARTIAL_CHARGES_SDF
+        molecule = Molecule.from_file(filename, toolkit_registry=rdkit_wrapper)
         assert molecule.partial_charges is not None
         assert molecule.partial_charges[0] == -0.4 * unit.elementary_charge
         assert molecule.partial_charges[-1] == 0.4 * unit.elementary_charge
 
-    def test_write_sdf_charges(self):
+    def test_write_sdf_charges(self, rdkit_wrapper, ethanol):
         """Test RDKitToolkitWrapper for writing partial charges to a sdf file"""
         from io import StringIO
 
-        toolkit_wrapper = RDKitToolkitWrapper()
-        ethanol = create_ethanol()
         sio = StringIO()
-        ethanol.to_file(sio, "SDF", toolkit_registry=toolkit_wrapper)
+        ethanol.to_file(sio, "SDF", toolkit_registry=rdkit_wrapper)
         sdf_text = sio.getvalue()
         # The output lines of interest here will look like
         # >  <atom.dprop.PartialCharge>  (1)
         # -0.40000000000000002 -0.29999999999999999 -0.20000000000000001 -0.10000000000000001 0.01 0.10000000000000001 0.20000000000000001 0.29999999999999999 0.40000000000000002
 
-        # Parse the SDF text, grabbing the numeric line above
-        sdf_split = sdf_text.split("\n")
-        charge_line_found = False
-        for line in sdf_split:
-            if charge_line_found:
-                charges = [float(i) for i in line.split()]
-                break
-            if ">  <atom.dprop.PartialCharge>" in line:
-                charge_line_found = True
+        assert ">  <atom.dprop.PartialCharge>" in sdf_text
 
-        # Make sure that a charge line was ever found
-        assert charge_line_found
+        match = _CHARGE_RE.search(sdf_text)
+        assert match is not None
+        charges = [float(i) for i in match.group(1).split()]
 
         # Make sure that the charges found were correct
         assert_almost_equal(
             charges, [-0.4, -0.3, -0.2, -0.1, 0.00001, 0.1, 0.2, 0.3, 0.4]
         )
 
-    def test_sdf_properties_roundtrip(self):
+    def test_sdf_properties_roundtrip(self, rdkit_wrapper, ethanol, tmp_path):
         """Test RDKitToolkitWrapper for performing a round trip of a molecule with defined partial charges
         and entries in the properties dict to and from a sdf file"""
-        toolkit_wrapper = RDKitToolkitWrapper()
-        ethanol = create_ethanol()
         # Write ethanol to a temporary file, and then immediately read it.
-        with NamedTemporaryFile(suffix=".sdf") as iofile:
-            ethanol.to_file(
-                iofile.name, file_format="SDF", toolkit_registry=toolkit_wrapper
-            )
-            ethanol2 = Molecule.from_file(
-                iofile.name, file_format="SDF", toolkit_registry=toolkit_wrapper
-            )
-        assert (ethanol.partial_charges == ethanol2.partial_charges).all()
+        iofile = str(tmp_path / "ethanol.sdf")
+        ethanol.to_file(iofile, file_format="SDF", toolkit_registry=rdkit_wrapper)
+        ethanol2 = Molecule.from_file(
+            iofile, file_format="SDF", toolkit_registry=rdkit_wrapper
+        )
+        assert np.array_equal(
+            ethanol.partial_charges / unit.elementary_charge,
+            ethanol2.partial_charges / unit.elementary_charge,
+        )
 
         # Now test with no properties or charges
         ethanol = create_ethanol()
         ethanol.partial_charges = None
         # Write ethanol to a temporary file, and then immediately read it.
-        with NamedTemporaryFile(suffix=".sdf") as iofile:
-            ethanol.to_file(
-                iofile.name, file_format="SDF", toolkit_registry=toolkit_wrapper
-            )
-            ethanol2 = Molecule.from_file(
-                iofile.name, file_format="SDF", toolkit_registry=toolkit_wrapper
-            )
+        iofile = str(tmp_path / "ethanol_no_charges.sdf")
+        ethanol.to_file(iofile, file_format="SDF", toolkit_registry=rdkit_wrapper)
+        ethanol2 = Molecule.from_file(
+            iofile, file_format="SDF", toolkit_registry=rdkit_wrapper
+        )
         assert ethanol2.partial_charges is None
         assert ethanol2.properties == {}
 
-    def test_write_sdf_no_charges(self):
+    def test_write_sdf_no_charges(self, rdkit_wrapper, ethanol):
         """Test RDKitToolkitWrapper for writing an SDF file with no charges"""
         from io import StringIO
 
-        toolkit_wrapper = RDKitToolkitWrapper()
-        ethanol = create_ethanol()
         ethanol.partial_charges = None
         sio = StringIO()
-        ethanol.to_file(sio, "SDF", toolkit_registry=toolkit_wrapper)
+        ethanol.to_file(sio, "SDF", toolkit_registry=rdkit_wrapper)
         sdf_text = sio.getvalue()
         # In our current configuration, if the OFFMol doesn't have partial charges, we DO NOT want a partial charge
         # block to be written. For reference, it's possible to indicate that a partial charge is not known by writing
         # out "n/a" (or another placeholder) in the partial charge block atoms without charges.
         assert ">  <atom.dprop.PartialCharge>" not in sdf_text
 
-    def test_load_multiconformer_sdf_as_separate_molecules(self):
-        """
-        Test RDKitToolkitWrapper for reading a "multiconformer" SDF, which the OFF
-        Toolkit should treat as separate molecules
-        """
-        toolkit_wrapper = RDKitToolkitWrapper()
-        filename = get_data_file_path("molecules/methane_multiconformer.sdf")
-        molecules = Molecule.from_file(filename, toolkit_registry=toolkit_wrapper)
-        assert len(molecules) == 2
-        assert len(molecules[0].conformers) == 1
-        assert len(molecules[1].conformers) == 1
-        assert molecules[0].conformers[0].shape == (5, 3)
-
-    def test_load_multiconformer_sdf_as_separate_molecules_properties(self):
+    def test_load_multiconformer_sdf_as_separate_molecules_properties(
+        self, rdkit_wrapper
+    ):
         """
         Test RDKitToolkitWrapper for reading a "multiconformer" SDF, which the OFF
         Toolkit should treat as separate molecules
         """
-        toolkit_wrapper = RDKitToolkitWrapper()
-        filename = get_data_file_path("molecules/methane_multiconformer_properties.sdf")
-        molecules = Molecule.from_file(filename, toolkit_registry=toolkit_wrapper)
+        filename = METHANE_MULTICONFORMER_PROPERTIES_SDF
+        molecules = Molecule.from_file(filename, toolkit_registry=rdkit_wrapper)
         assert len(molecules) == 2
         assert len(molecules[0].conformers) == 1
         assert len(molecules[1].conformers) == 1
@@ -1959,16 +1872,15 @@ class TestRDKitToolkitWrapper:
             [0.027170, 0.027170, 0.027170, 0.027170, -0.108680],
         )
 
-    def test_write_multiconformer_mol_as_sdf(self):
+    def test_write_multiconformer_mol_as_sdf(self, rdkit_wrapper):
         """
         Test RDKitToolkitWrapper for writing a multiconformer molecule to SDF. The OFF toolkit should only
         save the first conformer
         """
         from io import StringIO
 
-        toolkit_wrapper = RDKitToolkitWrapper()
-        filename = get_data_file_path("molecules/ethanol.sdf")
-        ethanol = Molecule.from_file(filename, toolkit_registry=toolkit_wrapper)
+        filename = ETHANOL_SDF
+        ethanol = Molecule.from_file(filename, toolkit_registry=rdkit_wrapper)
         ethanol.partial_charges = (
             np.array([-4.0, -3.0, -2.0, -1.0, 0.0, 1.0, 2.0, 3.0, 4.0])
             * unit.elementary_charge
@@ -1979,7 +1891,7 @@ class TestRDKitToolkitWrapper:
         )
         ethanol.add_conformer(new_conf)
         sio = StringIO()
-        ethanol.to_file(sio, "sdf", toolkit_registry=toolkit_wrapper)
+        ethanol.to_file(sio, "sdf", toolkit_registry=rdkit_wrapper)
         data = sio.getvalue()
         # In SD format, each molecule ends with "$$$$"
         assert data.count("$$$$") == 1
@@ -1994,23 +1906,23 @@ class TestRDKitToolkitWrapper:
             str(ethanol.conformers[1][0][0].in_units_of(unit.angstrom))[:5] not in data
         )
 
-    def test_write_multiconformer_pdb(self):
+    def test_write_multiconformer_pdb(self, rdkit_wrapper):
         """
         Make sure RDKit can write multi conformer PDB files.
         """
         from io import StringIO
 
-        toolkit = RDKitToolkitWrapper()
         # load up a multiconformer pdb file and condense down the conformers
         molecules = Molecule.from_file(
-            get_data_file_path("molecules/butane_multi.sdf"), toolkit_registry=toolkit
+            BUTANE_MULTI_SDF,
+            toolkit_registry=rdkit_wrapper,
         )
         butane = molecules.pop(0)
         for mol in molecules:
             butane.add_conformer(mol.conformers[0])
         assert butane.n_conformers == 7
         sio = StringIO()
-        butane.to_file(sio, "pdb", toolkit_registry=toolkit)
+        butane.to_file(sio, "pdb", toolkit_registry=rdkit_wrapper)
         # we need to make sure each conformer is wrote to the file
         pdb = sio.getvalue()
         for i in range(1, 8):
@@ -2018,136 +1930,31 @@ class TestRDKitToolkitWrapper:
 
     # Unskip this when we implement PDB-reading support for RDKitToolkitWrapper
     @pytest.mark.skip
-    def test_get_pdb_coordinates(self):
+    def test_get_pdb_coordinates(self, rdkit_wrapper):
         """Test RDKitToolkitWrapper for importing a single set of coordinates from a pdb file"""
-        toolkit_wrapper = RDKitToolkitWrapper()
-        filename = get_data_file_path("molecules/toluene.pdb")
-        molecule = Molecule.from_file(filename, toolkit_registry=toolkit_wrapper)
+        filename = TOLUENE_PDB
+        molecule = Molecule.from_file(filename, toolkit_registry=rdkit_wrapper)
         assert len(molecule.conformers) == 1
         assert molecule.conformers[0].shape == (15, 3)
 
     # Unskip this when we implement PDB-reading support for RDKitToolkitWrapper
     @pytest.mark.skip
-    def test_load_aromatic_pdb(self):
+    def test_load_aromatic_pdb(self, rdkit_wrapper):
         """Test OpenEyeToolkitWrapper for importing molecule conformers"""
-        toolkit_wrapper = RDKitToolkitWrapper()
-        filename = get_data_file_path("molecules/toluene.pdb")
-        molecule = Molecule.from_file(filename, toolkit_registry=toolkit_wrapper)
+        filename = TOLUENE_PDB
+        molecule = Molecule.from_file(filename, toolkit_registry=rdkit_wrapper)
         assert len(molecule.conformers) == 1
         assert molecule.conformers[0].shape == (15, 3)
 
-    def test_generate_conformers(self):
+    def test_generate_conformers(self, rdkit_wrapper):
         """Test RDKitToolkitWrapper generate_conformers()"""
-        toolkit_wrapper = RDKitToolkitWrapper()
         smiles = "[H]C([H])([H])C([H])([H])[H]"
-        molecule = toolkit_wrapper.from_smiles(smiles)
-        molecule.generate_conformers()
+        molecule = rdkit_wrapper.from_smiles(smiles)
+        # The geometry isn't checked, so skip the distance geometry initial guess
+        rdkit_wrapper.generate_conformers(molecule, use_random_coords=True)
+        assert molecule.n_conformers == 1
         # TODO: Make this test more robust
 
-    def test_generate_multiple_conformers(self):
-        """Test RDKitToolkitWrapper generate_conformers() for generating multiple conformers"""
-        toolkit_wrapper = RDKitToolkitWrapper()
-        smiles = "CCCCCCC"
-        molecule = toolkit_wrapper.from_smiles(smiles)
-        molecule.generate_conformers(
-            rms_cutoff=1 * unit.angstrom,
-            n_conformers=100,
-            toolkit_registry=toolkit_wrapper,
-        )
-        assert molecule.n_conformers > 1
-        assert not (molecule.conformers[0] == (0.0 * unit.angstrom)).all()
-
-        # Ensure rms_cutoff kwarg is working
-        molecule2 = toolkit_wrapper.from_smiles(smiles)
-        molecule2.generate_conformers(
-            rms_cutoff=0.1 * unit.angstrom,
-            n_conformers=100,
-            toolkit_registry=toolkit_wrapper,
-        )
-        assert molecule2.n_conformers > molecule.n_conformers
-
-        # Ensure n_conformers kwarg is working
-        molecule2 = toolkit_wrapper.from_smiles(smiles)
-        molecule2.generate_conformers(
-            rms_cutoff=0.1 * unit.angstrom,
-            n_conformers=10,
-            toolkit_registry=toolkit_wrapper,
-        )
-        assert molecule2.n_conformers == 10
-
-    def test_find_rotatable_bonds(self):
-        """Test finding rotatable bonds while ignoring some groups"""
-
-        # test a simple molecule
-        ethanol = create_ethanol()
-        bonds = ethanol.find_rotatable_bonds()
-        assert len(bonds) == 2
-        for bond in bonds:
-            assert ethanol.atoms[bond.atom1_index].atomic_number != 1
-            assert ethanol.atoms[bond.atom2_index].atomic_number != 1
-
-        # now ignore the C-O bond, forwards
-        bonds = ethanol.find_rotatable_bonds(ignore_functional_groups="[#6:1]-[#8:2]")
-        assert len(bonds) == 1
-        assert ethanol.atoms[bonds[0].atom1_index].atomic_number == 6
-        assert ethanol.atoms[bonds[0].atom2_index].atomic_number == 6
-
-        # now ignore the O-C bond, backwards
-        bonds = ethanol.find_rotatable_bonds(ignore_functional_groups="[#8:1]-[#6:2]")
-        assert len(bonds) == 1
-        assert ethanol.atoms[bonds[0].atom1_index].atomic_number == 6
-        assert ethanol.atoms[bonds[0].atom2_index].atomic_number == 6
-
-        # now ignore the C-C bond
-        bonds = ethanol.find_rotatable_bonds(ignore_functional_groups="[#6:1]-[#6:2]")
-        assert len(bonds) == 1
-        assert ethanol.atoms[bonds[0].atom1_index].atomic_number == 6
-        assert ethanol.atoms[bonds[0].atom2_index].atomic_number == 8
-
-        # ignore a list of searches, forward
-        bonds = ethanol.find_rotatable_bonds(
-            ignore_functional_groups=["[#6:1]-[#8:2]", "[#6:1]-[#6:2]"]
-        )
-        assert bonds == []
-
-        # ignore a list of searches, backwards
-        bonds = ethanol.find_rotatable_bonds(
-            ignore_functional_groups=["[#6:1]-[#6:2]", "[#8:1]-[#6:2]"]
-        )
-        assert bonds == []
-
-        # test  molecules that should have no rotatable bonds
-        cyclohexane = create_cyclohexane()
-        bonds = cyclohexane.find_rotatable_bonds()
-        assert bonds == []
-
-        methane = Molecule.from_smiles("C")
-        bonds = methane.find_rotatable_bonds()
-        assert bonds == []
-
-        ethene = Molecule.from_smiles("C=C")
-        bonds = ethene.find_rotatable_bonds()
-        assert bonds == []
-
-        terminal_forwards = "[*]~[*:1]-[X2H1,X3H2,X4H3:2]-[#1]"
-        terminal_backwards = "[#1]-[X2H1,X3H2,X4H3:1]-[*:2]~[*]"
-        # test removing terminal rotors
-        toluene = Molecule.from_file(get_data_file_path("molecules/toluene.sdf"))
-        bonds = toluene.find_rotatable_bonds()
-        assert len(bonds) == 1
-        assert toluene.atoms[bonds[0].atom1_index].atomic_number == 6
-        assert toluene.atoms[bonds[0].atom2_index].atomic_number == 6
-
-        # find terminal bonds forward
-        bonds = toluene.find_rotatable_bonds(ignore_functional_groups=terminal_forwards)
-        assert bonds == []
-
-        # find terminal bonds backwards
-        bonds = toluene.find_rotatable_bonds(
-            ignore_functional_groups=terminal_backwards
-        )
-        assert bonds == []
-
     def test_to_rdkit_losing_aromaticity_(self):
         # test the example given in issue #513
         # <https://github.com/openforcefield/openforcefield/issues/513>
@@ -2157,18 +1964,20 @@ class TestRDKitToolkitWrapper:
         rdmol = mol.to_rdkit()
 
         # now make sure the aromaticity matches for each atom
-        for (offatom, rdatom) in zip(mol.atoms, rdmol.GetAtoms()):
-            assert offatom.is_aromatic is rdatom.GetIsAromatic()
+        assert [atom.is_aromatic for atom in mol.atoms] == [
+            rdatom.GetIsAromatic() for rdatom in rdmol.GetAtoms()
+        ]
 
     @pytest.mark.slow
-    def test_substructure_search_on_large_molecule(self):
+    def test_substructure_search_on_large_molecule(self, rdkit_wrapper):
         """Test RDKitToolkitWrapper substructure search when a large number hits are found"""
 
-        tk = RDKitToolkitWrapper()
         smiles = "C" * 3000
-        molecule = tk.from_smiles(smiles)
+        molecule = rdkit_wrapper.from_smiles(smiles)
         query = "[C:1]~[C:2]"
-        ret = molecule.chemical_environment_matches(query, toolkit_registry=tk)
+        ret = molecule.chemical_environment_matches(
+            query, toolkit_registry=rdkit_wrapper
+        )
         assert len(ret) == 5998
         assert len(ret[0]) == 2
 
@@ -2181,52 +1990,59 @@ class TestRDKitToolkitWrapper:
         # TODO: Add read/write tests for gzipped files
         # TODO: Add write tests for all formats
 
+    def test_find_smarts_matches_reuses_parsed_query(self, rdkit_wrapper, ethanol):
+        """Test RDKitToolkitWrapper find_smarts_matches() parses a repeated SMARTS only once"""
+        RDKitToolkitWrapper._parse_smarts.cache_clear()
+        expected_matches = rdkit_wrapper.find_smarts_matches(
+            ethanol, C_O_FORWARDS_SMARTS
+        )
+        matches = rdkit_wrapper.find_smarts_matches(ethanol, C_O_FORWARDS_SMARTS)
+        cache_info = RDKitToolkitWrapper._parse_smarts.cache_info()
+        assert (cache_info.misses, cache_info.hits) == (1, 1)
+        assert matches == expected_matches
+
+        # Each caller gets its own copy of the cached query
+        qmol1, _ = RDKitToolkitWrapper._compile_smarts(C_O_FORWARDS_SMARTS)
+        qmol2, _ = RDKitToolkitWrapper._compile_smarts(C_O_FORWARDS_SMARTS)
+        assert qmol1 is not qmol2
+
 
 @requires_ambertools
 @requires_rdkit
 class TestAmberToolsToolkitWrapper:
     """Test the AmberToolsToolkitWrapper"""
 
-    def test_compute_partial_charges_am1bcc(self):
+    @pytest.mark.slow
+    @pytest.mark.ambertools
+    def test_compute_partial_charges_am1bcc(self, ambertools_registry, ethanol):
         """Test AmberToolsToolkitWrapper compute_partial_charges_am1bcc()"""
-        toolkit_registry = ToolkitRegistry(
-            toolkit_precedence=[AmberToolsToolkitWrapper, RDKitToolkitWrapper]
-        )
-        molecule = create_ethanol()
-        molecule.compute_partial_charges_am1bcc(toolkit_registry=toolkit_registry)
-        charge_sum = 0 * unit.elementary_charge
-        abs_charge_sum = 0 * unit.elementary_charge
-        for pc in molecule._partial_charges:
-            charge_sum += pc
-            abs_charge_sum += abs(pc)
-        assert abs(charge_sum) < 0.001 * unit.elementary_charge
-        assert abs_charge_sum > 0.25 * unit.elementary_charge
-
-    def test_compute_partial_charges_am1bcc_net_charge(self):
+        molecule = ethanol
+        molecule.compute_partial_charges_am1bcc(toolkit_registry=ambertools_registry)
+        partial_charges = molecule._partial_charges / unit.elementary_charge
+        assert abs(partial_charges.sum()) < 0.001
+        assert np.abs(partial_charges).sum() > 0.25
+
+    @pytest.mark.slow
+    @pytest.mark.ambertools
+    def test_compute_partial_charges_am1bcc_net_charge(
+        self, ambertools_registry, acetate
+    ):
         """Test AmberToolsToolkitWrapper assign_partial_charges() on a molecule with a net -1 charge"""
-        toolkit_registry = ToolkitRegistry(
-            toolkit_precedence=[AmberToolsToolkitWrapper, RDKitToolkitWrapper]
-        )
-        molecule = create_acetate()
-        molecule.compute_partial_charges_am1bcc(toolkit_registry=toolkit_registry)
-        charge_sum = 0 * unit.elementary_charge
-        for pc in molecule._partial_charges:
-            charge_sum += pc
-        assert (
-            -0.99 * unit.elementary_charge > charge_sum > -1.01 * unit.elementary_charge
-        )
+        molecule = acetate
+        molecule.compute_partial_charges_am1bcc(toolkit_registry=ambertools_registry)
+        charge_sum = (molecule._partial_charges / unit.elementary_charge).sum()
+        assert -0.99 > charge_sum > -1.01
 
-    def test_compute_partial_charges_am1bcc_wrong_n_confs(self):
+    @pytest.mark.slow
+    @pytest.mark.ambertools
+    def test_compute_partial_charges_am1bcc_wrong_n_confs(
+        self, ambertools_registry, ambertools_wrapper, ethanol
+    ):
         """
         Test AmberToolsToolkitWrapper compute_partial_charges_am1bcc() when requesting to use an incorrect number of
         conformers
         """
-        from openforcefield.tests.test_forcefield import create_ethanol
-
-        toolkit_registry = ToolkitRegistry(
-            toolkit_precedence=[AmberToolsToolkitWrapper, RDKitToolkitWrapper]
-        )
-        molecule = create_ethanol()
+        molecule = ethanol
         molecule.generate_conformers(n_conformers=2, rms_cutoff=0.1 * unit.angstrom)
 
         # Try passing in the incorrect number of confs, but without specifying strict_n_conformers,
@@ -2236,7 +2052,7 @@ class TestAmberToolsToolkitWrapper:
             match="has 2 conformers, but charge method 'am1bcc' expects exactly 1.",
         ):
             molecule.compute_partial_charges_am1bcc(
-                toolkit_registry=toolkit_registry,
+                toolkit_registry=ambertools_registry,
                 use_conformers=molecule.conformers,
                 strict_n_conformers=False,
             )
@@ -2244,18 +2060,21 @@ class TestAmberToolsToolkitWrapper:
         # Try again, with strict_n_confs as true, but not including use_confs, so the
         # recommended number of confs will be generated
         molecule.compute_partial_charges_am1bcc(
-            toolkit_registry=toolkit_registry, strict_n_conformers=True
+            toolkit_registry=ambertools_registry, strict_n_conformers=True
+        )
+
+        expected_message = (
+            "has 2 conformers, but charge method 'am1bcc' expects exactly 1."
         )
 
         # Test calling the ToolkitWrapper _indirectly_, though the Molecule API,
         # which should raise the first error encountered
         with pytest.raises(
             ValueError,
-            match=f"has 2 conformers, but charge method 'am1bcc' "
-            f"expects exactly 1.",
+            match=expected_message,
         ):
             molecule.compute_partial_charges_am1bcc(
-                toolkit_registry=toolkit_registry,
+                toolkit_registry=ambertools_registry,
                 use_conformers=molecule.conformers,
                 strict_n_conformers=True,
             )
@@ -2266,10 +2085,9 @@ class TestAmberToolsToolkitWrapper:
         # in a failed task together in a single ValueError.
         with pytest.raises(
             ValueError,
-            match=f"has 2 conformers, but charge method 'am1bcc' "
-            f"expects exactly 1.",
+            match=expected_message,
         ):
-            toolkit_registry.call(
+            ambertools_registry.call(
                 "compute_partial_charges_am1bcc",
                 molecule=molecule,
                 use_conformers=molecule.conformers,
@@ -2281,52 +2099,53 @@ class TestAmberToolsToolkitWrapper:
         # confs, and specify strict_n_conformers, which should produce an IncorrectNumConformersError
         with pytest.raises(
             IncorrectNumConformersError,
-            match=f"has 2 conformers, but charge method 'am1bcc' "
-            f"expects exactly 1.",
+            match=expected_message,
         ):
-            ATTKW = AmberToolsToolkitWrapper()
-            ATTKW.compute_partial_charges_am1bcc(
+            ambertools_wrapper.compute_partial_charges_am1bcc(
                 molecule=molecule,
                 use_conformers=molecule.conformers,
                 strict_n_conformers=True,
             )
 
     @pytest.mark.parametrize(
-        "partial_charge_method", ["am1bcc", "am1-mulliken", "gasteiger"]
+        "partial_charge_method",
+        [
+            pytest.param("am1bcc", marks=[pytest.mark.slow, pytest.mark.ambertools]),
+            "am1-mulliken",
+            "gasteiger",
+        ],
     )
-    def test_assign_partial_charges_neutral(self, partial_charge_method):
+    def test_assign_partial_charges_neutral(
+        self, ambertools_registry, ethanol, partial_charge_method
+    ):
         """Test AmberToolsToolkitWrapper assign_partial_charges()"""
-        from openforcefield.tests.test_forcefield import create_ethanol
-
-        toolkit_registry = ToolkitRegistry(
-            toolkit_precedence=[AmberToolsToolkitWrapper, RDKitToolkitWrapper]
-        )
-        molecule = create_ethanol()
+        molecule = ethanol
         molecule.assign_partial_charges(
-            toolkit_registry=toolkit_registry,
+            toolkit_registry=ambertools_registry,
             partial_charge_method=partial_charge_method,
         )
-        charge_sum = 0.0 * unit.elementary_charge
-        for pc in molecule.partial_charges:
-            charge_sum += pc
-        assert -1.0e-5 < charge_sum.value_in_unit(unit.elementary_charge) < 1.0e-5
+        charge_sum = (molecule.partial_charges / unit.elementary_charge).sum()
+        assert -1.0e-5 < charge_sum < 1.0e-5
 
-    @pytest.mark.parametrize("partial_charge_method", ["am1bcc", "am1-mulliken"])
-    def test_assign_partial_charges_conformer_dependence(self, partial_charge_method):
+    @pytest.mark.parametrize(
+        "partial_charge_method",
+        [
+            pytest.param("am1bcc", marks=[pytest.mark.slow, pytest.mark.ambertools]),
+            "am1-mulliken",
+        ],
+    )
+    def test_assign_partial_charges_conformer_dependence(
+        self, ambertools_registry, ethanol, partial_charge_method
+    ):
         """Test AmberToolsToolkitWrapper assign_partial_charges()'s use_conformers kwarg
         to ensure charges are really conformer dependent. Skip Gasteiger because it isn't
         conformer dependent."""
         import copy
 
-        from openforcefield.tests.test_forcefield import create_ethanol
-
-        toolkit_registry = ToolkitRegistry(
-            toolkit_precedence=[AmberToolsToolkitWrapper, RDKitToolkitWrapper]
-        )
-        molecule = create_ethanol()
+        molecule = ethanol
         molecule.generate_conformers(n_conformers=1)
         molecule.assign_partial_charges(
-            toolkit_registry=toolkit_registry,
+            toolkit_registry=ambertools_registry,
             partial_charge_method=partial_charge_method,
             use_conformers=molecule.conformers,
         )
@@ -2335,7 +2154,7 @@ class TestAmberToolsToolkitWrapper:
         # stores partial charges to 1e-3
         molecule._conformers[0][0][0] += 3.0 * unit.angstrom
         molecule.assign_partial_charges(
-            toolkit_registry=toolkit_registry,
+            toolkit_registry=ambertools_registry,
             partial_charge_method=partial_charge_method,
             use_conformers=molecule.conformers,
         )
@@ -2343,35 +2162,32 @@ class TestAmberToolsToolkitWrapper:
             assert abs(pc1 - pc2) > 1.0e-3 * unit.elementary_charge
 
     @pytest.mark.parametrize(
-        "partial_charge_method", ["am1bcc", "am1-mulliken", "gasteiger"]
+        "partial_charge_method",
+        [
+            pytest.param("am1bcc", marks=[pytest.mark.slow, pytest.mark.ambertools]),
+            "am1-mulliken",
+            "gasteiger",
+        ],
     )
-    def test_assign_partial_charges_net_charge(self, partial_charge_method):
+    def test_assign_partial_charges_net_charge(
+        self, ambertools_registry, partial_charge_method, acetate
+    ):
         """
         Test AmberToolsToolkitWrapper assign_partial_charges().
         """
-        from openforcefield.tests.test_forcefield import create_acetate
-
-        toolkit_registry = ToolkitRegistry(
-            toolkit_precedence=[AmberToolsToolkitWrapper, RDKitToolkitWrapper]
-        )
-        molecule = create_acetate()
+        molecule = acetate
         molecule.assign_partial_charges(
-            toolkit_registry=toolkit_registry,
+            toolkit_registry=ambertools_registry,
             partial_charge_method=partial_charge_method,
         )
-        charge_sum = 0.0 * unit.elementary_charge
-        for pc in molecule.partial_charges:
-            charge_sum += pc
-        assert -1.01 < charge_sum.value_in_unit(unit.elementary_charge) < -0.99
+        charge_sum = (molecule.partial_charges / unit.elementary_charge).sum()
+        assert -1.01 < charge_sum < -0.99
 
-    def test_assign_partial_charges_bad_charge_method(self):
+    def test_assign_partial_charges_bad_charge_method(
+        self, ambertools_registry, ambertools_wrapper, ethanol
+    ):
         """Test AmberToolsToolkitWrapper assign_partial_charges() for a nonexistent charge method"""
-        from openforcefield.tests.test_forcefield import create_ethanol
-
-        toolkit_registry = ToolkitRegistry(
-            toolkit_precedence=[AmberToolsToolkitWrapper, RDKitToolkitWrapper]
-        )
-        molecule = create_ethanol()
+        molecule = ethanol
 
         # For now, ToolkitRegistries lose track of what exception type
         # was thrown inside them, so we just check for a ValueError here
@@ -2379,7 +2195,7 @@ class TestAmberToolsToolkitWrapper:
             ValueError, match="is not available from AmberToolsToolkitWrapper"
         ) as excinfo:
             molecule.assign_partial_charges(
-                toolkit_registry=toolkit_registry,
+                toolkit_registry=ambertools_registry,
                 partial_charge_method="NotARealChargeMethod",
             )
 
@@ -2388,39 +2204,46 @@ class TestAmberToolsToolkitWrapper:
             ChargeMethodUnavailableError,
             match="is not available from AmberToolsToolkitWrapper",
         ) as excinfo:
-            ATTKW = AmberToolsToolkitWrapper()
-            ATTKW.assign_partial_charges(
+            ambertools_wrapper.assign_partial_charges(
                 molecule=molecule, partial_charge_method="NotARealChargeMethod"
             )
 
     @pytest.mark.parametrize(
         "partial_charge_method,expected_n_confs",
-        [("am1bcc", 1), ("am1-mulliken", 1), ("gasteiger", 0)],
+        [
+            pytest.param("am1bcc", 1, marks=[pytest.mark.slow, pytest.mark.ambertools]),
+            ("am1-mulliken", 1),
+            ("gasteiger", 0),
+        ],
     )
     def test_assign_partial_charges_wrong_n_confs(
-        self, partial_charge_method, expected_n_confs
+        self,
+        ambertools_registry,
+        ambertools_wrapper,
+        ethanol,
+        partial_charge_method,
+        expected_n_confs,
     ):
         """
         Test AmberToolsToolkitWrapper assign_partial_charges() when requesting to use an incorrect number of
         conformers
         """
-        from openforcefield.tests.test_forcefield import create_ethanol
+        molecule = ethanol
+        molecule.generate_conformers(n_conformers=2, rms_cutoff=0.01 * unit.angstrom)
 
-        toolkit_registry = ToolkitRegistry(
-            toolkit_precedence=[AmberToolsToolkitWrapper, RDKitToolkitWrapper]
+        expected_message = (
+            f"has 2 conformers, but charge method '{partial_charge_method}' "
+            f"expects exactly {expected_n_confs}."
         )
-        molecule = create_ethanol()
-        molecule.generate_conformers(n_conformers=2, rms_cutoff=0.01 * unit.angstrom)
 
         # Try passing in the incorrect number of confs, but without specifying strict_n_conformers,
         # which should produce a warning
         with pytest.warns(
             IncorrectNumConformersWarning,
-            match=f"has 2 conformers, but charge method '{partial_charge_method}' "
-            f"expects exactly {expected_n_confs}.",
+            match=expected_message,
         ):
             molecule.assign_partial_charges(
-                toolkit_registry=toolkit_registry,
+                toolkit_registry=ambertools_registry,
                 partial_charge_method=partial_charge_method,
                 use_conformers=molecule.conformers,
                 strict_n_conformers=False,
@@ -2429,7 +2252,7 @@ class TestAmberToolsToolkitWrapper:
         # Try again, with strict_n_confs as true, but not including use_confs, so the
         # recommended number of confs will be generated
         molecule.assign_partial_charges(
-            toolkit_registry=toolkit_registry,
+            toolkit_registry=ambertools_registry,
             partial_charge_method=partial_charge_method,
             strict_n_conformers=True,
         )
@@ -2439,11 +2262,10 @@ class TestAmberToolsToolkitWrapper:
         # in a failed task together in a single ValueError.
         with pytest.raises(
             ValueError,
-            match=f"has 2 conformers, but charge method '{partial_charge_method}' "
-            f"expects exactly {expected_n_confs}.",
+            match=expected_message,
         ):
             molecule.assign_partial_charges(
-                toolkit_registry=toolkit_registry,
+                toolkit_registry=ambertools_registry,
                 partial_charge_method=partial_charge_method,
                 use_conformers=molecule.conformers,
                 strict_n_conformers=True,
@@ -2453,129 +2275,74 @@ class TestAmberToolsToolkitWrapper:
         # confs, and specify strict_n_conformers, which should produce an IncorrectNumConformersError
         with pytest.raises(
             IncorrectNumConformersError,
-            match=f"has 2 conformers, but charge method '{partial_charge_method}' "
-            f"expects exactly {expected_n_confs}.",
+            match=expected_message,
         ):
-            ATTKW = AmberToolsToolkitWrapper()
-            ATTKW.assign_partial_charges(
+            ambertools_wrapper.assign_partial_charges(
                 molecule=molecule,
                 partial_charge_method=partial_charge_method,
                 use_conformers=molecule.conformers,
                 strict_n_conformers=True,
             )
 
-    def test_assign_fractional_bond_orders(self):
-        """Test OpenEyeToolkitWrapper assign_fractional_bond_orders()"""
+    @pytest.mark.parametrize(
+        "smiles",
+        [
+            pytest.param("[H]C([H])([H])C([H])([H])[H]", id="neutral"),
+            pytest.param("[H]C([H])([H])[N+]([H])([H])[H]", id="charged"),
+        ],
+    )
+    def test_assign_fractional_bond_orders(self, ambertools_registry, smiles):
+        """Test AmberToolsToolkitWrapper assign_fractional_bond_orders() on a neutral
+        molecule and on a molecule with net charge +1"""
 
-        toolkit_registry = ToolkitRegistry(
-            toolkit_precedence=[AmberToolsToolkitWrapper, RDKitToolkitWrapper]
+        molecule = ambertools_registry.call("from_smiles", smiles)
+        molecule.assign_fractional_bond_orders(
+            toolkit_registry=ambertools_registry, bond_order_model="am1-wiberg"
         )
-        smiles = "[H]C([H])([H])C([H])([H])[H]"
-        molecule = toolkit_registry.call("from_smiles", smiles)
-        for bond_order_model in ["am1-wiberg"]:
-            molecule.assign_fractional_bond_orders(
-                toolkit_registry=toolkit_registry, bond_order_model=bond_order_model
-            )
-            # TODO: Add test for equivalent Wiberg orders for equivalent bonds
+        # TODO: Add test for equivalent Wiberg orders for equivalent bonds
 
-    def test_assign_fractional_bond_orders_neutral_charge_mol(self):
+    def test_assign_fractional_bond_orders_neutral_charge_mol(
+        self, ambertools_registry, cid20742535_neutral, cid20742535_anion
+    ):
         """Test OpenEyeToolkitWrapper assign_fractional_bond_orders() for neutral and charged molecule.
         Also tests using existing conformers"""
 
-        toolkit_registry = ToolkitRegistry(
-            toolkit_precedence=[AmberToolsToolkitWrapper, RDKitToolkitWrapper]
-        )
-        # Reading neutral molecule from file
-        filename = get_data_file_path("molecules/CID20742535_neutral.sdf")
-        molecule1 = Molecule.from_file(filename)
-        # Reading negative molecule from file
-        filename = get_data_file_path("molecules/CID20742535_anion.sdf")
-        molecule2 = Molecule.from_file(filename)
+        molecule1 = cid20742535_neutral
+        molecule2 = cid20742535_anion
 
         # Checking that only one additional bond is present in the neutral molecule
         assert len(molecule1.bonds) == len(molecule2.bonds) + 1
 
-        for bond_order_model in ["am1-wiberg"]:
-            molecule1.assign_fractional_bond_orders(
-                toolkit_registry=toolkit_registry,
-                bond_order_model=bond_order_model,
-                use_conformers=molecule1.conformers,
-            )
-
-            for i in molecule1.bonds:
-                if i.is_aromatic:
-                    # Checking aromatic bonds
-                    assert 1.05 < i.fractional_bond_order < 1.65
-                elif i.atom1.atomic_number == 1 or i.atom2.atomic_number == 1:
-                    # Checking bond order of C-H or O-H bonds are around 1
-                    assert 0.85 < i.fractional_bond_order < 1.05
-                elif i.atom1.atomic_number == 8 or i.atom2.atomic_number == 8:
-                    # Checking C-O single bond
-                    wbo_C_O_neutral = i.fractional_bond_order
-                    assert 1.0 < wbo_C_O_neutral < 1.5
-                else:
-                    # Should be C-C single bond
-                    assert (i.atom1_index == 4 and i.atom2_index == 6) or (
-                        i.atom1_index == 6 and i.atom2_index == 4
-                    )
-                    wbo_C_C_neutral = i.fractional_bond_order
-                    assert 1.0 < wbo_C_C_neutral < 1.3
-
-            molecule2.assign_fractional_bond_orders(
-                toolkit_registry=toolkit_registry,
-                bond_order_model=bond_order_model,
-                use_conformers=molecule2.conformers,
-            )
-            for i in molecule2.bonds:
-                if i.is_aromatic:
-                    # Checking aromatic bonds
-                    assert 1.05 < i.fractional_bond_order < 1.65
-
-                elif i.atom1.atomic_number == 1 or i.atom2.atomic_number == 1:
-                    # Checking bond order of C-H or O-H bonds are around 1
-                    assert 0.85 < i.fractional_bond_order < 1.05
-                elif i.atom1.atomic_number == 8 or i.atom2.atomic_number == 8:
-                    # Checking C-O single bond
-                    wbo_C_O_anion = i.fractional_bond_order
-                    assert 1.3 < wbo_C_O_anion < 1.8
-                else:
-                    # Should be C-C single bond
-                    assert (i.atom1_index == 4 and i.atom2_index == 6) or (
-                        i.atom1_index == 6 and i.atom2_index == 4
-                    )
-                    wbo_C_C_anion = i.fractional_bond_order
-                    assert 1.0 < wbo_C_C_anion < 1.3
-
-            # Wiberg bond order of C-C single bond is higher in the anion
-            assert wbo_C_C_anion > wbo_C_C_neutral
-            # Wiberg bond order of C-O bond is higher in the anion
-            assert wbo_C_O_anion > wbo_C_O_neutral
+        molecule1.assign_fractional_bond_orders(
+            toolkit_registry=ambertools_registry,
+            bond_order_model="am1-wiberg",
+            use_conformers=molecule1.conformers,
+        )
 
-    def test_assign_fractional_bond_orders_charged(self):
-        """Test OpenEyeToolkitWrapper assign_fractional_bond_orders() on a molecule with net charge +1"""
+        wbo_C_O_neutral, wbo_C_C_neutral = _validate_wbos(molecule1, 1.0, 1.5)
 
-        toolkit_registry = ToolkitRegistry(
-            toolkit_precedence=[AmberToolsToolkitWrapper, RDKitToolkitWrapper]
+        molecule2.assign_fractional_bond_orders(
+            toolkit_registry=ambertools_registry,
+            bond_order_model="am1-wiberg",
+            use_conformers=molecule2.conformers,
         )
-        smiles = "[H]C([H])([H])[N+]([H])([H])[H]"
-        molecule = toolkit_registry.call("from_smiles", smiles)
-        for bond_order_model in ["am1-wiberg"]:
-            molecule.assign_fractional_bond_orders(
-                toolkit_registry=toolkit_registry, bond_order_model=bond_order_model
-            )
-            # TODO: Add test for equivalent Wiberg orders for equivalent bonds
+        wbo_C_O_anion, wbo_C_C_anion = _validate_wbos(molecule2, 1.3, 1.8)
 
-    def test_assign_fractional_bond_orders_invalid_method(self):
+        # Wiberg bond order of C-C single bond is higher in the anion
+        assert wbo_C_C_anion > wbo_C_C_neutral
+        # Wiberg bond order of C-O bond is higher in the anion
+        assert wbo_C_O_anion > wbo_C_O_neutral
+
+    def test_assign_fractional_bond_orders_invalid_method(
+        self, ambertools_registry, ambertools_wrapper
+    ):
         """
         Test that AmberToolsToolkitWrapper.assign_fractional_bond_orders() raises the
         correct error if an invalid charge model is provided
         """
 
-        toolkit_registry = ToolkitRegistry(
-            toolkit_precedence=[AmberToolsToolkitWrapper, RDKitToolkitWrapper]
-        )
         smiles = "[H]C([H])([H])[N+]([H])([H])[H]"
-        molecule = toolkit_registry.call("from_smiles", smiles)
+        molecule = ambertools_registry.call("from_smiles", smiles)
 
         expected_error = (
             "Bond order model 'not a real charge model' is not supported by "
@@ -2583,76 +2350,61 @@ class TestAmberToolsToolkitWrapper:
         )
         with pytest.raises(ValueError, match=expected_error) as excinfo:
             molecule.assign_fractional_bond_orders(
-                toolkit_registry=AmberToolsToolkitWrapper(),
+                toolkit_registry=ambertools_wrapper,
                 bond_order_model="not a real charge model",
             )
 
-    def test_assign_fractional_bond_orders_double_bond(self):
+    def test_assign_fractional_bond_orders_double_bond(self, ambertools_registry):
         """Test OpenEyeToolkitWrapper assign_fractional_bond_orders() on a molecule with a double bond"""
 
-        toolkit_registry = ToolkitRegistry(
-            toolkit_precedence=[AmberToolsToolkitWrapper, RDKitToolkitWrapper]
-        )
         smiles = r"C\C(F)=C(/F)C[C@@](C)(Cl)Br"
-        molecule = toolkit_registry.call("from_smiles", smiles)
-        for bond_order_model in ["am1-wiberg"]:
-            molecule.assign_fractional_bond_orders(
-                toolkit_registry=toolkit_registry, bond_order_model=bond_order_model
-            )
-            # TODO: Add test for equivalent Wiberg orders for equivalent bonds
+        molecule = ambertools_registry.call("from_smiles", smiles)
+        molecule.assign_fractional_bond_orders(
+            toolkit_registry=ambertools_registry, bond_order_model="am1-wiberg"
+        )
+        # TODO: Add test for equivalent Wiberg orders for equivalent bonds
 
-        double_bond_has_wbo_near_2 = False
-        for bond in molecule.bonds:
-            if bond.bond_order == 2:
-                if 1.75 < bond.fractional_bond_order < 2.25:
-                    double_bond_has_wbo_near_2 = True
-        assert double_bond_has_wbo_near_2
+        assert any(
+            bond.bond_order == 2 and 1.75 < bond.fractional_bond_order < 2.25
+            for bond in molecule.bonds
+        )
 
 
 class TestBuiltInToolkitWrapper:
     """Test the BuiltInToolkitWrapper"""
 
     @pytest.mark.parametrize("partial_charge_method", ["zeros", "formal_charge"])
-    def test_assign_partial_charges_neutral(self, partial_charge_method):
+    def test_assign_partial_charges_neutral(
+        self, builtin_registry, ethanol, partial_charge_method
+    ):
         """Test BuiltInToolkitWrapper assign_partial_charges()"""
-        from openforcefield.tests.test_forcefield import create_ethanol
-
-        toolkit_registry = ToolkitRegistry(toolkit_precedence=[BuiltInToolkitWrapper])
-        molecule = create_ethanol()
+        molecule = ethanol
         molecule.assign_partial_charges(
-            toolkit_registry=toolkit_registry,
+            toolkit_registry=builtin_registry,
             partial_charge_method=partial_charge_method,
         )
-        charge_sum = 0.0 * unit.elementary_charge
-        for pc in molecule.partial_charges:
-            charge_sum += pc
-        assert -1.0e-6 < charge_sum.value_in_unit(unit.elementary_charge) < 1.0e-6
+        charge_sum = (molecule.partial_charges / unit.elementary_charge).sum()
+        assert -1.0e-6 < charge_sum < 1.0e-6
 
     @pytest.mark.parametrize("partial_charge_method", ["formal_charge"])
-    def test_assign_partial_charges_net_charge(self, partial_charge_method):
+    def test_assign_partial_charges_net_charge(
+        self, builtin_registry, partial_charge_method, acetate
+    ):
         """
         Test BuiltInToolkitWrapper assign_partial_charges(). Only formal_charge is tested, since zeros will not
         sum up to the proper number
         """
-        from openforcefield.tests.test_forcefield import create_acetate
-
-        toolkit_registry = ToolkitRegistry(toolkit_precedence=[BuiltInToolkitWrapper])
-        molecule = create_acetate()
+        molecule = acetate
         molecule.assign_partial_charges(
-            toolkit_registry=toolkit_registry,
+            toolkit_registry=builtin_registry,
             partial_charge_method=partial_charge_method,
         )
-        charge_sum = 0.0 * unit.elementary_charge
-        for pc in molecule.partial_charges:
-            charge_sum += pc
-        assert -1.0e-6 < charge_sum.value_in_unit(unit.elementary_charge) + 1.0 < 1.0e-6
+        charge_sum = (molecule.partial_charges / unit.elementary_charge).sum()
+        assert -1.0e-6 < charge_sum + 1.0 < 1.0e-6
 
-    def test_assign_partial_charges_bad_charge_method(self):
+    def test_assign_partial_charges_bad_charge_method(self, builtin_registry, ethanol):
         """Test BuiltInToolkitWrapper assign_partial_charges() for a nonexistent charge method"""
-        from openforcefield.tests.test_forcefield import create_ethanol
-
-        toolkit_registry = ToolkitRegistry(toolkit_precedence=[BuiltInToolkitWrapper])
-        molecule = create_ethanol()
+        molecule = ethanol
 
         # For now, the Molecule API passes raise_exception_types=[] to ToolkitRegistry.call,
         # which loses track of what exception type
@@ -2661,7 +2413,7 @@ class TestBuiltInToolkitWrapper:
             ValueError, match="is not supported by the Built-in toolkit"
         ) as excinfo:
             molecule.assign_partial_charges(
-                toolkit_registry=toolkit_registry,
+                toolkit_registry=builtin_registry,
                 partial_charge_method="NotARealChargeMethod",
             )
 
@@ -2675,22 +2427,19 @@ class TestBuiltInToolkitWrapper:
                 molecule=molecule, partial_charge_method="NotARealChargeMethod"
             )
 
-    def test_assign_partial_charges_wrong_n_confs(self):
+    def test_assign_partial_charges_wrong_n_confs(self, builtin_registry, ethanol):
         """
         Test BuiltInToolkitWrapper assign_partial_charges() when requesting to use an incorrect number of
         conformers
         """
-        from openforcefield.tests.test_forcefield import create_ethanol
-
-        toolkit_registry = ToolkitRegistry(toolkit_precedence=[BuiltInToolkitWrapper])
-        molecule = create_ethanol()
+        molecule = ethanol
         molecule.generate_conformers(n_conformers=1)
         with pytest.warns(
             IncorrectNumConformersWarning,
             match="has 1 conformers, but charge method 'zeros' expects exactly 0.",
         ):
             molecule.assign_partial_charges(
-                toolkit_registry=toolkit_registry,
+                toolkit_registry=builtin_registry,
                 partial_charge_method="zeros",
                 use_conformers=molecule.conformers,
                 strict_n_conformers=False,
@@ -2699,20 +2448,24 @@ class TestBuiltInToolkitWrapper:
         # Specify strict_n_conformers=True, but not use_conformers, so a recommended number of
         # conformers will be generated internally
         molecule.assign_partial_charges(
-            toolkit_registry=toolkit_registry,
+            toolkit_registry=builtin_registry,
             partial_charge_method="zeros",
             strict_n_conformers=True,
         )
 
+        expected_message = (
+            "has 1 conformers, but charge method 'zeros' expects exactly 0."
+        )
+
         # For now, the Molecule API passes raise_exception_types=[] to ToolkitRegistry.call,
         # which loses track of what exception type
         # was thrown inside them, so we just check for a ValueError here
         with pytest.raises(
             ValueError,
-            match=f"has 1 conformers, but charge method 'zeros' " f"expects exactly 0.",
+            match=expected_message,
         ):
             molecule.assign_partial_charges(
-                toolkit_registry=toolkit_registry,
+                toolkit_registry=builtin_registry,
                 partial_charge_method="zeros",
                 use_conformers=molecule.conformers,
                 strict_n_conformers=True,
@@ -2722,7 +2475,7 @@ class TestBuiltInToolkitWrapper:
         # confs, and specify strict_n_conformers, which should produce an IncorrectNumConformersError
         with pytest.raises(
             IncorrectNumConformersError,
-            match=f"has 1 conformers, but charge method 'zeros' " f"expects exactly 0.",
+            match=expected_message,
         ):
             BITKW = BuiltInToolkitWrapper()
             BITKW.assign_partial_charges(
@@ -2736,10 +2489,10 @@ class TestBuiltInToolkitWrapper:
 class TestToolkitWrapper:
     """Test the ToolkitWrapper class"""
 
-    def test_check_n_conformers(self):
+    def test_check_n_conformers(self, ethanol):
         """Ensure that _check_n_conformers is working properly"""
         tkw = ToolkitWrapper()
-        mol = create_ethanol()
+        mol = ethanol
 
         ## Test molecule with no conformers
         # Check with no min or max should pass
@@ -2942,9 +2695,9 @@ class TestToolkitRegistry:
             toolkit_precedence=toolkit_precedence,
         )
 
-        assert set(type(c) for c in registry.registered_toolkits) == set(
-            [OpenEyeToolkitWrapper]
-        )
+        assert {type(c) for c in registry.registered_toolkits} == {
+            OpenEyeToolkitWrapper
+        }
 
         # Test ToolkitRegistry.resolve()
         assert (
@@ -2966,9 +2719,7 @@ class TestToolkitRegistry:
             toolkit_precedence=toolkit_precedence,
         )
 
-        assert set([type(c) for c in registry.registered_toolkits]) == set(
-            [RDKitToolkitWrapper]
-        )
+        assert {type(c) for c in registry.registered_toolkits} == {RDKitToolkitWrapper}
 
         # Test ToolkitRegistry.resolve()
         assert (
@@ -2982,7 +2733,9 @@ class TestToolkitRegistry:
         assert smiles == smiles2
 
     @requires_ambertools
-    def test_register_ambertools(self):
+    @pytest.mark.slow
+    @pytest.mark.ambertools
+    def test_register_ambertools(self, ethanol_sdf):
         """Test creation of toolkit registry with AmberToolsToolkitWrapper"""
         # Test registration of AmberToolsToolkitWrapper
         toolkit_precedence = [AmberToolsToolkitWrapper]
@@ -2990,9 +2743,9 @@ class TestToolkitRegistry:
             toolkit_precedence=toolkit_precedence,
         )
 
-        assert set([type(c) for c in registry.registered_toolkits]) == set(
-            [AmberToolsToolkitWrapper]
-        )
+        assert {type(c) for c in registry.registered_toolkits} == {
+            AmberToolsToolkitWrapper
+        }
 
         # Test ToolkitRegistry.resolve()
         registry.resolve("assign_partial_charges")
@@ -3002,9 +2755,7 @@ class TestToolkitRegistry:
         )
 
         # Test ToolkitRegistry.call()
-        molecule = RDKitToolkitWrapper().from_file(
-            file_path=get_data_file_path("molecules/ethanol.sdf"), file_format="SDF"
-        )[0]
+        molecule = ethanol_sdf
         registry.call("assign_partial_charges", molecule)
         charges_from_registry = molecule.partial_charges
         AmberToolsToolkitWrapper().assign_partial_charges(molecule)
@@ -3013,6 +2764,8 @@ class TestToolkitRegistry:
         assert np.allclose(charges_from_registry, charges_from_toolkit)
 
     @requires_ambertools
+    @pytest.mark.slow
+    @pytest.mark.ambertools
     def test_register_rdkit_and_ambertools(self):
         """Test creation of toolkit registry with RDKitToolkitWrapper and AmberToolsToolkitWrapper"""
         toolkit_precedence = [RDKitToolkitWrapper, AmberToolsToolkitWrapper]
@@ -3020,9 +2773,10 @@ class TestToolkitRegistry:
             toolkit_precedence=toolkit_precedence,
         )
 
-        assert set([type(c) for c in registry.registered_toolkits]) == set(
-            [RDKitToolkitWrapper, AmberToolsToolkitWrapper]
-        )
+        assert {type(c) for c in registry.registered_toolkits} == {
+            RDKitToolkitWrapper,
+            AmberToolsToolkitWrapper,
+        }
 
         # Test ToolkitRegistry.resolve()
         assert (
@@ -3046,11 +2800,12 @@ class TestToolkitRegistry:
         registry.call("assign_partial_charges", molecule)
 
     @requires_ambertools
-    def test_deregister_toolkit(self):
+    def test_deregister_toolkit(self, ambertools_registry):
         """Test removing an instantiated toolkit from the registry"""
-        toolkit_registry = ToolkitRegistry(
-            toolkit_precedence=[AmberToolsToolkitWrapper, RDKitToolkitWrapper]
-        )
+        from copy import deepcopy
+
+        # Work on a copy so the shared session registry is left untouched
+        toolkit_registry = deepcopy(ambertools_registry)
 
         assert any(
             [
@@ -3085,11 +2840,12 @@ class TestToolkitRegistry:
         )
 
     @requires_ambertools
-    def test_deregister_toolkit_by_class(self):
+    def test_deregister_toolkit_by_class(self, ambertools_registry):
         """Test removing a toolkit from the registry by matching class types"""
-        toolkit_registry = ToolkitRegistry(
-            toolkit_precedence=[AmberToolsToolkitWrapper, RDKitToolkitWrapper]
-        )
+        from copy import deepcopy
+
+        # Work on a copy so the shared session registry is left untouched
+        toolkit_registry = deepcopy(ambertools_registry)
 
         assert any(
             [
@@ -3166,9 +2922,9 @@ class TestToolkitRegistry:
             toolkit_precedence=toolkit_precedence,
         )
         # registry.register_toolkit(BuiltInToolkitWrapper)
-        assert set([type(c) for c in registry.registered_toolkits]) == set(
-            [BuiltInToolkitWrapper]
-        )
+        assert {type(c) for c in registry.registered_toolkits} == {
+            BuiltInToolkitWrapper
+        }
 
         # Test ToolkitRegistry.resolve()
         assert (
@@ -209,6 +209,7 @@ class Atom(Particle):
         >>> atom = Atom(6, 0, False, stereochemistry='R', name='CT')
 
         """
+        self._molecule = molecule
         self._atomic_number = atomic_number
         # Use the setter here, since it will handle either ints or Quantities
         self.formal_charge = formal_charge
@@ -217,7 +218,6 @@ class Atom(Particle):
         if name is None:
             name = ""
         self._name = name
-        self._molecule = molecule
         ## From Jeff: I'm going to assume that this is implicit in the parent Molecule's ordering of atoms
         # self._molecule_atom_index = molecule_atom_index
         self._bonds = list()
@@ -288,6 +288,8 @@ class Atom(Particle):
         else:
             check_units_are_compatible("formal charge", other, unit.elementary_charge)
             self._formal_charge = other
+        if self._molecule is not None:
+            self._molecule._invalidate_cached_smiles()
 
     @property
     def partial_charge(self):
@@ -330,6 +332,8 @@ class Atom(Particle):
         # if (value != 'CW') and (value != 'CCW') and not(value is None):
         #    raise Exception("Atom stereochemistry setter expected 'CW', 'CCW', or None. Received {} (type {})".format(value, type(value)))
         self._stereochemistry = value
+        if self._molecule is not None:
+            self._molecule._invalidate_cached_smiles()
 
     @property
     def element(self):
@@ -1342,6 +1346,8 @@ class Bond(Serializable):
     @bond_order.setter
     def bond_order(self, value):
         self._bond_order = value
+        if self._molecule is not None:
+            self._molecule._invalidate_cached_smiles()
 
     @property
     def fractional_bond_order(self):
@@ -2323,9 +2329,18 @@ class FrozenMolecule(Serializable):
             if strip_pyrimidal_n_atom_stereo:
                 SMARTS = "[N+0X3:1](-[*])(-[*])(-[*])"
 
+            def has_nitrogen_stereo(molecule):
+                """Whether any nitrogen in the molecule has defined stereochemistry"""
+                return any(
+                    atom.atomic_number == 7 and atom.stereochemistry is not None
+                    for atom in molecule.atoms
+                )
+
             if isinstance(data, FrozenMolecule):
                 # Molecule class instance
-                if strip_pyrimidal_n_atom_stereo:
+                # Only strip the stereo (which requires a copy of the molecule and a
+                # toolkit SMARTS match) if there is nitrogen stereo to remove
+                if strip_pyrimidal_n_atom_stereo and has_nitrogen_stereo(data):
                     # Make a copy of the molecule so we don't modify the original
                     data = deepcopy(data)
                     data.strip_atom_stereochemistry(
@@ -2334,9 +2349,10 @@ class FrozenMolecule(Serializable):
                 return data.to_networkx()
             elif isinstance(data, TopologyMolecule):
                 # TopologyMolecule class instance
-                if strip_pyrimidal_n_atom_stereo:
+                ref_mol = data.reference_molecule
+                if strip_pyrimidal_n_atom_stereo and has_nitrogen_stereo(ref_mol):
                     # Make a copy of the molecule so we don't modify the original
-                    ref_mol = deepcopy(data.reference_molecule)
+                    ref_mol = deepcopy(ref_mol)
                     ref_mol.strip_atom_stereochemistry(
                         SMARTS, toolkit_registry=toolkit_registry
                     )
@@ -2667,9 +2683,16 @@ class FrozenMolecule(Serializable):
         self._propers = None
         self._impropers = None
 
-        self._cached_smiles = None
+        self._invalidate_cached_smiles()
         # TODO: Clear fractional bond orders
 
+    def _invalidate_cached_smiles(self):
+        """
+        Drop any cached SMILES, e.g. after an atom's formal charge or stereochemistry
+        or a bond's order has been changed.
+        """
+        self._cached_smiles = None
+
     def to_networkx(self):
         """Generate a NetworkX undirected graph from the Molecule.
 
@@ -4059,7 +4082,7 @@ class FrozenMolecule(Serializable):
 
     @staticmethod
     @OpenEyeToolkitWrapper.requires_toolkit()
-    def from_openeye(oemol, allow_undefined_stereo=False):
+    def from_openeye(oemol, allow_undefined_stereo=False, perceive_aromaticity=True):
         """
         Create a Molecule from an OpenEye molecule.
 
@@ -4071,6 +4094,10 @@ class FrozenMolecule(Serializable):
             An OpenEye molecule
         allow_undefined_stereo : bool, default=False
             If false, raises an exception if oemol contains undefined stereochemistry.
+        perceive_aromaticity : bool, default=True
+            If true, assign aromaticity to oemol using the MDL aromaticity model. If false,
+            the aromaticity flags already on oemol are used as-is, which is only correct if
+            they were assigned with the MDL model (e.g. by ``to_openeye``).
 
         Returns
         -------
@@ -4091,7 +4118,9 @@ class FrozenMolecule(Serializable):
         """
         toolkit = OpenEyeToolkitWrapper()
         molecule = toolkit.from_openeye(
-            oemol, allow_undefined_stereo=allow_undefined_stereo
+            oemol,
+            allow_undefined_stereo=allow_undefined_stereo,
+            perceive_aromaticity=perceive_aromaticity,
         )
         return molecule
 
@@ -59,7 +59,7 @@ import logging
 import subprocess
 import tempfile
 from distutils.spawn import find_executable
-from functools import wraps
+from functools import lru_cache, wraps
 
 import numpy as np
 from simtk import unit
@@ -1215,7 +1215,7 @@ class OpenEyeToolkitWrapper(ToolkitWrapper):
             return None
 
     @staticmethod
-    def from_openeye(oemol, allow_undefined_stereo=False):
+    def from_openeye(oemol, allow_undefined_stereo=False, perceive_aromaticity=True):
         """
         Create a Molecule from an OpenEye molecule. If the OpenEye molecule has
         implicit hydrogens, this function will make them explicit.
@@ -1240,6 +1240,10 @@ class OpenEyeToolkitWrapper(ToolkitWrapper):
             An OpenEye molecule
         allow_undefined_stereo : bool, default=False
             If false, raises an exception if oemol contains undefined stereochemistry.
+        perceive_aromaticity : bool, default=True
+            If true, assign aromaticity to oemol using the MDL aromaticity model. If false,
+            the aromaticity flags already on oemol are used as-is, which is only correct if
+            they were assigned with the MDL model (e.g. by ``to_openeye``).
 
         Returns
         -------
@@ -1271,7 +1275,8 @@ class OpenEyeToolkitWrapper(ToolkitWrapper):
             oechem.OEAddExplicitHydrogens(oemol)
 
         # TODO: Is there any risk to perceiving aromaticity here instead of later?
-        oechem.OEAssignAromaticFlags(oemol, oechem.OEAroModel_MDL)
+        if perceive_aromaticity:
+            oechem.OEAssignAromaticFlags(oemol, oechem.OEAroModel_MDL)
 
         oechem.OEPerceiveChiral(oemol)
 
@@ -1403,18 +1408,15 @@ class OpenEyeToolkitWrapper(ToolkitWrapper):
         if hasattr(oemol, "GetConfs"):
             for conf in oemol.GetConfs():
                 n_atoms = molecule.n_atoms
-                positions = unit.Quantity(
-                    np.zeros([n_atoms, 3], np.float), unit.angstrom
-                )
-                for oe_id in conf.GetCoords().keys():
-                    off_atom_coords = unit.Quantity(
-                        conf.GetCoords()[oe_id], unit.angstrom
-                    )
-                    off_atom_index = map_atoms[oe_id]
-                    positions[off_atom_index, :] = off_atom_coords
-                if (positions == 0 * unit.angstrom).all() and n_atoms > 1:
+                positions = np.zeros([n_atoms, 3], np.float)
+                # GetCoords() builds a new dict of every atom's coordinates on each
+                # call, so fetch it once per conformer rather than once per atom
+                oe_coords = conf.GetCoords()
+                for oe_id, oe_atom_coords in oe_coords.items():
+                    positions[map_atoms[oe_id], :] = oe_atom_coords
+                if (positions == 0.0).all() and n_atoms > 1:
                     continue
-                molecule.add_conformer(positions)
+                molecule.add_conformer(unit.Quantity(positions, unit.angstrom))
 
         # Copy partial charges, if present
         partial_charges = unit.Quantity(
@@ -3154,7 +3156,12 @@ class RDKitToolkitWrapper(ToolkitWrapper):
         return molecule
 
     def generate_conformers(
-        self, molecule, n_conformers=1, rms_cutoff=None, clear_existing=True
+        self,
+        molecule,
+        n_conformers=1,
+        rms_cutoff=None,
+        clear_existing=True,
+        use_random_coords=False,
     ):
         """
         Generate molecule conformers using RDKit.
@@ -3178,6 +3185,10 @@ class RDKitToolkitWrapper(ToolkitWrapper):
 
         clear_existing : bool, default=True
             Whether to overwrite existing conformers for the molecule.
+        use_random_coords : bool, default=False
+            Whether to start embedding from random coordinates instead of the
+            distance geometry eigenvalue guess. This is faster on small molecules
+            but can give lower quality geometries.
 
 
         """
@@ -3192,6 +3203,7 @@ class RDKitToolkitWrapper(ToolkitWrapper):
             numConfs=n_conformers,
             pruneRmsThresh=rms_cutoff / unit.angstrom,
             randomSeed=1,
+            useRandomCoords=use_random_coords,
             # params=AllChem.ETKDG()
         )
         molecule2 = self.from_rdkit(rdmol, allow_undefined_stereo=True)
@@ -3742,6 +3754,67 @@ class RDKitToolkitWrapper(ToolkitWrapper):
         unique_tags = tuple(sorted(list(unique_tags)))
         return unique_tags, connections
 
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _parse_smarts(smirks):
+        """Parse a SMARTS string into an RDKit query molecule, caching the result.
+
+        The cached query is shared between calls; use ``_compile_smarts`` to obtain a
+        copy that is safe to use.
+
+        Parameters
+        ----------
+        smirks : str
+            SMARTS string with any number of sequentially tagged atoms.
+
+        Returns
+        -------
+        qmol : rdkit.Chem.Mol
+            The cached query molecule
+        map_list : tuple of int
+            The query atom indices of the tagged atoms, ordered by map index
+
+        """
+        from rdkit import Chem
+
+        qmol = Chem.MolFromSmarts(smirks)  # cannot catch the error
+        if qmol is None:
+            raise ValueError(
+                'RDKit could not parse the SMIRKS string "{}"'.format(smirks)
+            )
+
+        # Create atom mapping for query molecule
+        idx_map = dict()
+        for atom in qmol.GetAtoms():
+            smirks_index = atom.GetAtomMapNum()
+            if smirks_index != 0:
+                idx_map[smirks_index - 1] = atom.GetIdx()
+        map_list = tuple(idx_map[x] for x in sorted(idx_map))
+
+        return qmol, map_list
+
+    @staticmethod
+    def _compile_smarts(smirks):
+        """Return a copy of the cached RDKit query molecule for a SMARTS string.
+
+        Parameters
+        ----------
+        smirks : str
+            SMARTS string with any number of sequentially tagged atoms.
+
+        Returns
+        -------
+        qmol : rdkit.Chem.Mol
+            A copy of the query molecule, owned by the caller
+        map_list : tuple of int
+            The query atom indices of the tagged atoms, ordered by map index
+
+        """
+        from rdkit import Chem
+
+        qmol, map_list = RDKitToolkitWrapper._parse_smarts(smirks)
+        return Chem.Mol(qmol), map_list
+
     @staticmethod
     def _find_smarts_matches(rdmol, smirks, aromaticity_model="OEAroModel_MDL"):
         """Find all sets of atoms in the provided RDKit molecule that match the provided SMARTS string.
@@ -3783,19 +3856,7 @@ class RDKitToolkitWrapper(ToolkitWrapper):
             raise ValueError("Unknown aromaticity model: {}".aromaticity_models)
 
         # Set up query.
-        qmol = Chem.MolFromSmarts(smirks)  # cannot catch the error
-        if qmol is None:
-            raise ValueError(
-                'RDKit could not parse the SMIRKS string "{}"'.format(smirks)
-            )
-
-        # Create atom mapping for query molecule
-        idx_map = dict()
-        for atom in qmol.GetAtoms():
-            smirks_index = atom.GetAtomMapNum()
-            if smirks_index != 0:
-                idx_map[smirks_index - 1] = atom.GetIdx()
-        map_list = [idx_map[x] for x in sorted(idx_map)]
+        qmol, map_list = RDKitToolkitWrapper._compile_smarts(smirks)
 
         # Perform matching
         matches = list()
@@ -118,11 +118,14 @@ def temporary_cd(dir_path):
         os.chdir(prev_dir)
 
 
+@functools.lru_cache(maxsize=None)
 def get_data_file_path(relative_path):
     """Get the full path to one of the reference files in testsystems.
     In the source distribution, these files are in ``openforcefield/data/``,
     but on installation, they're moved to somewhere in the user's python
     site-packages directory.
+    Resolved paths are cached, since the installed data files do not move
+    while the process is running.
     Parameters
     ----------
     name : str